@@ -0,0 +1,64 @@
+"""Benchmark: per-turn cleaning cost with a rebuilt vs. a shared stopword set.
+
+Run from the repository root:
+
+    python benchmarks/bench_stopwords.py [transcript] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nltk.corpus import stopwords
+from nltk.tokenize import word_tokenize
+
+from debate_analysis.cleaning import CUSTOM_STOPWORDS, StopwordFilter, clean_text
+from debate_analysis.ingest import stream_turns
+
+
+def clean_text_rebuilding(text):
+    """The previous `clean_text`: the stopword set is rebuilt on every call."""
+    stop_words = set(stopwords.words('english'))
+    stop_words.update(CUSTOM_STOPWORDS)
+    words = word_tokenize(text)
+    words = [word for word in words if word.isalpha() and word.lower() not in stop_words]
+    return ' '.join(words)
+
+
+def time_per_turn(clean, statements, repeat):
+    """Return the best mean seconds per turn over `repeat` passes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for statement in statements:
+            clean(statement)
+        best = min(best, (time.perf_counter() - start) / len(statements))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('transcript', nargs='?', default='CNN_raw_transcript.txt')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    statements = [statement for _, _, statement in stream_turns([args.transcript])]
+    stopword_filter = StopwordFilter()
+
+    # Both variants must produce the same cleaned text
+    assert [clean_text_rebuilding(s) for s in statements] == [clean_text(s, stopword_filter) for s in statements]
+
+    rebuilt = time_per_turn(clean_text_rebuilding, statements, args.repeat)
+    shared = time_per_turn(lambda text: clean_text(text, stopword_filter), statements, args.repeat)
+
+    print(f"turns: {len(statements)}")
+    print(f"rebuilt stopword set: {rebuilt * 1e6:10.1f} us/turn")
+    print(f"shared StopwordFilter: {shared * 1e6:10.1f} us/turn")
+    print(f"speedup: {rebuilt / shared:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: tokenizing turns with NLTK's word_tokenize vs. the batch regex tokenizer.
+
+Run from the repository root:
+
+    python benchmarks/bench_tokenizer.py [transcript] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nltk.tokenize import word_tokenize
+
+from debate_analysis.cleaning import regex_tokenize_batch
+from debate_analysis.ingest import stream_turns
+
+# Cases where word_tokenize's Punkt and Treebank rules interact, with the alphabetic tokens it keeps
+REGRESSION_CASES = [
+    ("They don’t. Follow the money", ['They', 'don', 't', 'Follow', 'the', 'money']),
+    ("It wasn’t. He said so", ['It', 'wasn', 't', 'He', 'said', 'so']),
+    ("Roe v. Wade was overturned", ['Roe', 'Wade', 'was', 'overturned']),
+    ("Thank you, Mr. President", ['Thank', 'you', 'President']),
+    ("That is what I said.", ['That', 'is', 'what', 'I', 'said']),
+]
+
+
+def nltk_alphabetic_tokens(statements):
+    """The tokens `clean_text` keeps from word_tokenize: the alphabetic ones."""
+    return [[word for word in word_tokenize(statement) if word.isalpha()] for statement in statements]
+
+
+def best_time(tokenize, statements, repeat):
+    """Return the best seconds for tokenizing every statement over `repeat` passes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokenize(statements)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('transcript', nargs='?', default='CNN_raw_transcript.txt')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for text, tokens in REGRESSION_CASES:
+        if regex_tokenize_batch([text])[0] != tokens:
+            sys.exit(f"regex tokenizer regressed on {text!r}: {regex_tokenize_batch([text])[0]}")
+
+    statements = [statement for _, _, statement in stream_turns([args.transcript])]
+
+    # Both tokenizers must keep the same tokens, turn by turn
+    statements += [text for text, _ in REGRESSION_CASES]
+    expected, actual = nltk_alphabetic_tokens(statements), regex_tokenize_batch(statements)
+    mismatched = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    if mismatched:
+        sys.exit(f"tokenizers disagree on {len(mismatched)} of {len(statements)} turns, first at turn {mismatched[0]}")
+
+    nltk_seconds = best_time(nltk_alphabetic_tokens, statements, args.repeat)
+    regex_seconds = best_time(regex_tokenize_batch, statements, args.repeat)
+    n_tokens = sum(len(tokens) for tokens in actual)
+
+    print(f"turns: {len(statements)}, alphabetic tokens: {n_tokens}")
+    print(f"word_tokenize + isalpha: {nltk_seconds * 1e6 / len(statements):10.1f} us/turn")
+    print(f"regex batch tokenizer:   {regex_seconds * 1e6 / len(statements):10.1f} us/turn")
+    print(f"speedup: {nltk_seconds / regex_seconds:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
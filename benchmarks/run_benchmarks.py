@@ -0,0 +1,171 @@
+"""Benchmark suite for the segmentation, cleaning, counting and rendering stages.
+
+Each stage runs against the bundled transcript and against synthetic corpora made by
+repeating it 10x/100x/1000x, in a fresh process so peak memory is measured in isolation.
+Results can be saved as a named baseline and compared against later runs. From the
+repository root:
+
+    python benchmarks/run_benchmarks.py --scales 1,10,100 --save-baseline v1
+    python benchmarks/run_benchmarks.py --scales 1,10,100 --compare v1
+    python benchmarks/run_benchmarks.py --scales 1,10,100 --tokenizer regex --compare v1
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from debate_analysis.cleaning import TOKENIZERS
+from debate_analysis.profiling import _peak_rss_bytes
+
+BASELINE_DIR = os.path.join(ROOT, 'benchmarks', 'baselines')
+STAGES = ('segment', 'clean', 'count', 'render')
+
+
+def write_synthetic_corpus(transcript, scale, directory):
+    """Write a transcript file made of `scale` back-to-back copies of the source transcript."""
+    path = os.path.join(directory, f"synthetic_{scale}x.txt")
+    with open(transcript, 'r', encoding='utf-8') as f:
+        text = f.read().rstrip('\n') + '\n'
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(scale):
+            f.write(text)
+    return path
+
+
+def _run_stage(stage, scale, transcript, workdir, repeat=1, tokenizer='nltk'):
+    """Set up and time one stage at one scale (best of `repeat` runs) with a tokenizer backend; runs in a fresh process."""
+    from debate_analysis.analysis import word_frequency_analysis
+    from debate_analysis.cleaning import clean_text, clean_texts, default_stopword_filter
+    from debate_analysis.ingest import read_transcript_lines, segment_turns, stream_turns
+
+    turns = [(speaker, statement) for _, speaker, statement in stream_turns([transcript])]
+    stopword_filter = default_stopword_filter()
+
+    if stage == 'segment':
+        corpus = write_synthetic_corpus(transcript, scale, workdir)
+
+        def run():
+            n_turns = n_tokens = 0
+            for _, statement in segment_turns(read_transcript_lines(corpus)):
+                n_turns += 1
+                n_tokens += len(statement.split())
+            return n_turns, n_tokens
+
+    elif stage == 'clean':
+        statements = [statement for _, statement in turns] * scale
+
+        def run():
+            clean_texts(statements, stopword_filter, tokenizer)  # One batch, as the pipeline cleans a document
+            return len(statements), sum(len(statement.split()) for statement in statements)
+
+    elif stage == 'count':
+        cleaned = [clean_text(statement, stopword_filter, tokenizer) for _, statement in turns] * scale
+
+        def run():
+            word_counts = word_frequency_analysis(cleaned)
+            return len(cleaned), sum(word_counts.values())
+
+    elif stage == 'render':
+        from debate_analysis.render import render_word_cloud
+
+        cleaned = [clean_text(statement, stopword_filter, tokenizer) for speaker, statement in turns if speaker == 'BIDEN'] * scale
+        word_counts = word_frequency_analysis(cleaned)
+        output_path = os.path.join(workdir, f"render_{scale}x.png")
+
+        def run():
+            render_word_cloud(word_counts, 'BIDEN', output_path)
+            return 1, sum(word_counts.values())
+
+    else:
+        raise ValueError(f"Unknown stage '{stage}', expected one of {STAGES}")
+
+    rss_before = _peak_rss_bytes()
+    wall = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        n_turns, n_tokens = run()
+        wall = min(wall, time.perf_counter() - start)
+    rss_after = _peak_rss_bytes()
+    rss_known = rss_before is not None and rss_after is not None  # Peak RSS is not available on Windows
+
+    return {'stage': stage, 'scale': scale, 'tokenizer': tokenizer, 'wall_s': wall, 'turns': n_turns, 'tokens': n_tokens,
+            'turns_per_s': n_turns / wall if wall else float('inf'),
+            'tokens_per_s': n_tokens / wall if wall else float('inf'),
+            'peak_rss_mb': rss_after / 2 ** 20 if rss_known else None,
+            'rss_growth_mb': (rss_after - rss_before) / 2 ** 20 if rss_known else None}
+
+
+def run_benchmarks(stages, scales, transcript, repeat=1, tokenizer='nltk'):
+    """Run every stage at every scale, each in its own process, and return the result rows."""
+    context = multiprocessing.get_context('spawn')  # A clean interpreter, so peak memory is not inherited
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for stage in stages:
+            for scale in scales:
+                with context.Pool(1) as pool:
+                    result = pool.apply(_run_stage, (stage, scale, transcript, workdir, repeat, tokenizer))
+                print_result(result)
+                results.append(result)
+    return results
+
+
+def print_result(result, baseline=None):
+    line = (f"{result['stage']:>8} {result['scale']:>6}x  {result['wall_s']:9.3f} s  {result['turns_per_s']:12.1f} turns/s  "
+            f"{result['tokens_per_s']:14.1f} tokens/s")
+    if result['peak_rss_mb'] is not None:
+        line += f"  {result['peak_rss_mb']:8.1f} MB peak (+{result['rss_growth_mb']:.1f})"
+    if baseline is not None:
+        line += f"  {baseline['wall_s'] / result['wall_s']:5.2f}x vs baseline"
+    print(line, flush=True)
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name, results):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Baseline saved to '{baseline_path(name)}'")
+
+
+def compare_with_baseline(name, results):
+    """Print each result next to its speedup over the same stage and scale in a saved baseline."""
+    with open(baseline_path(name), 'r', encoding='utf-8') as f:
+        baseline = {(row['stage'], row['scale']): row for row in json.load(f)}  # Any tokenizer, to compare backends
+    print(f"\nCompared with baseline '{name}' (>1x is faster):")
+    for result in results:
+        print_result(result, baseline.get((result['stage'], result['scale'])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--transcript', default=os.path.join(ROOT, 'CNN_raw_transcript.txt'))
+    parser.add_argument('--stages', default=','.join(STAGES), help="comma-separated stages (default: all)")
+    parser.add_argument('--scales', default='1,10,100,1000', help="comma-separated corpus scale factors")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage and scale; the fastest is reported")
+    parser.add_argument('--tokenizer', choices=TOKENIZERS, default='nltk', help="tokenizer backend (default: nltk)")
+    parser.add_argument('--save-baseline', metavar='NAME', help="save the results as benchmarks/baselines/NAME.json")
+    parser.add_argument('--compare', metavar='NAME', help="compare the results with a saved baseline")
+    args = parser.parse_args()
+
+    stages = args.stages.split(',')
+    scales = [int(scale) for scale in args.scales.split(',')]
+    results = run_benchmarks(stages, scales, os.path.abspath(args.transcript), args.repeat, args.tokenizer)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+    if args.compare:
+        compare_with_baseline(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""Helpers for the 2024 presidential debate thematic analysis.
+
+The analysis script (`2024_presidential_debate_analysis.py`) drives these modules;
+each module can also be imported on its own to process other transcripts.
+Importing the package is cheap: NLTK, the plotting stack and NumPy/SciPy are only
+imported by the functions that use them.
+"""
+
+from debate_analysis.analysis import plot_word_cloud, segregate_statements_and_export, word_frequency_analysis
+
+__all__ = ['plot_word_cloud', 'segregate_statements_and_export', 'word_frequency_analysis']
@@ -0,0 +1,107 @@
+"""The analysis steps of the debate script: segregating statements, word frequencies and word clouds.
+
+Importing this module does not run any analysis, download data or import the plotting stack.
+"""
+
+from collections import Counter
+
+from debate_analysis.cleaning import default_stopword_filter
+from debate_analysis.ingest import SPEAKERS
+from debate_analysis.pipeline import clean_documents, transcript_documents
+from debate_analysis.profiling import NULL_INSTRUMENTATION
+from debate_analysis.speakers import SpeakerMatcher
+
+
+def segregate_statements_and_export(transcript, output_file, stopword_filter=None, workers=1, matcher=None, cache=None,
+                                    instrumentation=None, columnar_dir=None, index=None, timeline=None,
+                                    tokenizer='nltk', normalizer=None, summaries=None):
+    """Segregate the transcript into statements by each speaker and export the cleaned statements to a text file.
+
+    The transcript can be given as the raw text or as a list of transcript files/directories, which are streamed line by line.
+    The stopword filter is built once and shared by every turn; the default NLTK + custom list is used when none is given.
+    Statements are tokenized with NLTK's word_tokenize, or with a faster regex tokenizer approximating it when `tokenizer='regex'`.
+    With more than one worker, turns are segmented in bounded groups of documents and each group is cleaned across a process pool.
+    Speaker tags (including full-name tags such as 'JAKE TAPPER, CNN MODERATOR:') are resolved by the speaker matcher;
+    by default only the four speakers of the CNN debate are kept.
+    With a content cache, the cleaned turns of unchanged transcripts are reused instead of being recomputed.
+    With a `Normalizer`, cleaned statements are also case-folded and lemmatized or stemmed before anything is exported or counted.
+    The segment, clean and export stages are recorded by `instrumentation` when one is given.
+    With `columnar_dir`, the cleaned turns are also exported in turn order as token-id columns (see `debate_analysis.columnar`).
+    With an `InvertedIndex`, every cleaned turn is also indexed as it is segregated; likewise a `SlidingWindowTimeline`
+    receives each debate's cleaned turns in their original order, and `SpeakerSummaries` summarize every debate's speakers.
+    """
+    if stopword_filter is None:
+        stopword_filter = default_stopword_filter()
+    if instrumentation is None:
+        instrumentation = NULL_INSTRUMENTATION
+
+    speaker_segments = {}  # Statements of each speaker the matcher yields, in order of first appearance
+
+    if matcher is None:
+        matcher = SpeakerMatcher(SPEAKERS)
+
+    documents = transcript_documents(transcript, fingerprint=cache is not None)
+    columnar_writer = None
+    if columnar_dir is not None:
+        from debate_analysis.columnar import ColumnarWriter  # Imported lazily: needs NumPy
+
+        columnar_writer = ColumnarWriter(columnar_dir)
+
+    for debate_id, cleaned_turns in clean_documents(documents, matcher, stopword_filter, workers=workers, cache=cache,
+                                                    instrumentation=instrumentation, tokenizer=tokenizer):
+        if normalizer is not None:
+            with instrumentation.stage('normalize', items=len(cleaned_turns)):
+                cleaned_turns = normalizer.normalize_turns(cleaned_turns)
+        for speaker, cleaned_statement in cleaned_turns:
+            speaker_segments.setdefault(speaker, []).append(cleaned_statement)  # Save the cleaned statement in turn order
+        if columnar_writer is not None:
+            with instrumentation.stage('export', items=len(cleaned_turns)):
+                columnar_writer.add_turns(debate_id, cleaned_turns)
+        if index is not None:
+            with instrumentation.stage('index', items=len(cleaned_turns)):
+                index.add_document(debate_id, cleaned_turns)
+        if timeline is not None:
+            with instrumentation.stage('count', items=len(cleaned_turns)):
+                timeline.add_document(debate_id, cleaned_turns)
+        if summaries is not None:
+            with instrumentation.stage('count', items=len(cleaned_turns)):
+                summaries.add_document(debate_id, cleaned_turns)
+
+    if columnar_writer is not None:
+        columnar_writer.close()
+        print(f"Columnar transcript exported to '{columnar_dir}'")
+
+    with instrumentation.stage('export') as event, open(output_file, 'w', encoding='utf-8') as f:
+        for speaker, statements in speaker_segments.items():
+            f.write(f"{speaker}: cleaned statements:\n")
+            for statement in statements:
+                f.write(f"- {statement}\n")
+            f.write("\n")
+            event.items += len(statements)
+    
+    print(f"Cleaned transcript exported to '{output_file}'")
+    
+    return speaker_segments
+
+
+def word_frequency_analysis(speaker_statements):
+    """Perform word frequency analysis on the cleaned statements of a speaker."""
+    word_counts = Counter()
+    for statement in speaker_statements:
+        word_counts.update(statement.split())  # Count the words of each statement as it is split
+
+    return word_counts  # Return word counts
+
+
+def plot_word_cloud(word_counts, speaker):
+    """Generate and plot a word cloud based on word frequencies for a given speaker."""
+    import matplotlib.pyplot as plt  # Imported lazily: the plotting stack is only needed to display clouds
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(width=1000, height=800, background_color='Black').generate_from_frequencies(word_counts)  # Generate a word cloud
+
+    plt.figure(figsize=(15, 8))  # Set figure size
+    plt.imshow(wordcloud, interpolation='bilinear')  # Display the word cloud
+    plt.title(f"Word Cloud for {speaker}")  # Set title
+    plt.axis('off')  # Hide axis
+    plt.show()  # Show the plot
@@ -0,0 +1,100 @@
+"""Content-addressed on-disk cache with size-bounded LRU eviction."""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+
+def make_key(*parts):
+    """Hash the parts of a cache key (input text or fingerprints, configuration, versions) into a hex digest."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(hashlib.sha256(part).digest())  # Hash each part separately so part boundaries cannot shift
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """Blobs stored under `directory` by content key, evicting the least recently used once `max_bytes` is exceeded.
+
+    Entries are files named by their key; a hit refreshes the file's modification time, which is
+    the recency used for eviction, so the order survives across runs.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # Key -> size in bytes, least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        found = []
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(found):
+            self.entries[key] = size
+            self.total_bytes += size
+        self._evict()  # The size limit may be lower than in a previous run
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """Return the cached bytes for a key, or None on a miss."""
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:  # Removed by another process
+            self.total_bytes -= self.entries.pop(key)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store bytes under a key, then evict old entries until the cache fits in `max_bytes`."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        self.total_bytes -= self.entries.pop(key, 0)
+        self.entries[key] = len(data)
+        self.total_bytes += len(data)
+        self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            key, size = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def get_json(self, key):
+        data = self.get(key)
+        return None if data is None else json.loads(data.decode('utf-8'))
+
+    def put_json(self, key, value):
+        self.put(key, json.dumps(value, ensure_ascii=False).encode('utf-8'))
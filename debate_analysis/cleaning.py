@@ -0,0 +1,261 @@
+"""Cleaning of speaker statements: tokenization and stopword removal."""
+
+import functools
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from debate_analysis.resources import ensure_nltk_resources
+
+#  Custom stopwords for omitting additional non-impactful words and verbs not contributing to context in the word cloud
+CUSTOM_STOPWORDS = ["President", "president", "number", "time", "want", "wants", "lot", "look", "took", "come", "times", "could", "went",
+                    "debate", "thank", "done", "Thank", "like", "going", "said", "us", "one", "back", "seen", "Well", "day", "ago",
+                    "make", "sure", "never", "think", "know", "would", "fact", "things", "coming", "made", "many", "get", "got",
+                    "put", "take", "thing", "see", "three", "place", "wanted", "situation", "good", "every", "much", "say", "says",
+                    "guy", "even", "across", "year", "brought", "whole", "able", "way", "ever", "right", "go", "still", "half"]
+
+
+TOKENIZERS = ('nltk', 'regex')  # Selectable tokenizer backends; 'nltk' is NLTK's word_tokenize
+
+REGEX_TOKENIZER_VERSION = 1  # Bump whenever the regex tokenizer's output changes, to invalidate cached cleaning results
+
+# Characters word_tokenize always splits off as tokens of their own: quotes (including the transcript's curly
+# apostrophes), brackets, dashes and most punctuation. Periods, commas, colons and hyphens only split in some contexts.
+_SEPARATORS = r"\s\0«“‘„`»”’\";@#$%&\u2012-\u2015?!*()\[\]{}<>"
+
+# One token: a run of non-separator characters, where a comma or colon is kept only before a digit ('3,000')
+# and a period or hyphen only when it is not doubled ('U.S.', 'late-term', but 'wait...' and 'well--'). NUL marks
+# the end of a text in a batch.
+_TOKEN_PATTERN = re.compile(rf"(?:[^{_SEPARATORS}.,:-]|[,:](?=\d)|(?<!\.)\.(?!\.)|(?<!-)-(?!-))+|\0")
+
+# A word with a straight-apostrophe contraction, reduced to its alphabetic head the way word_tokenize splits it
+_APOSTROPHE_PATTERN = re.compile(r"(?:'(?!(?:re|ve|ll|m|t|s|d|n)\b))?([^\W\d_]+?)(?:n't|'(?:[smd]|ll|re|ve)?)?", re.IGNORECASE)
+
+# Characters Punkt does not let a word start with; a token right after one of them (or after whitespace) is a whole
+# Punkt word, whereas one after a curly apostrophe or quote is only the tail of a word ('t.' in 'don’t.')
+_PUNKT_WORD_BOUNDARY = frozenset('\0("`{[:;&#*@)}]-,')
+
+# Words word_tokenize splits in two ('cannot' -> 'can', 'not'); all of them split after the third letter
+_SPLIT_WORDS = frozenset(['cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna'])
+
+# Abbreviations whose period Punkt does not treat as a sentence end, so word_tokenize keeps it ('Mr.') and the token
+# is dropped as non-alphabetic; single letters ('Roe v. Wade') are treated the same way
+PUNKT_ABBREVIATIONS = frozenset(['mr', 'mrs', 'ms', 'dr', 'jr', 'sr', 'st', 'vs', 'gen', 'gov', 'sen', 'rep', 'lt', 'col',
+                                 'sgt', 'capt', 'prof', 'rev', 'hon', 'etc', 'inc', 'corp', 'ltd'])
+
+
+def tokenizer_version(tokenizer='nltk'):
+    """Describe the tokenizer in use; part of cache keys, since cleaned text depends on it."""
+    if tokenizer == 'regex':
+        return f"regex-{REGEX_TOKENIZER_VERSION}"
+    import nltk  # Imported lazily: importing NLTK takes over a second
+
+    return f"nltk-{nltk.__version__}-word_tokenize"
+
+
+@functools.lru_cache(maxsize=None)
+def _word_tokenizer():
+    """Import NLTK's word tokenizer on first use, after checking its data is installed locally."""
+    ensure_nltk_resources(['tokenizer'])
+    from nltk.tokenize import word_tokenize
+
+    return word_tokenize
+
+
+def _append_word(words, word):
+    if len(word) in (5, 6) and word.casefold() in _SPLIT_WORDS:
+        words.extend((word[:3], word[3:]))
+    else:
+        words.append(word)
+
+
+def regex_tokenize_batch(texts):
+    """Tokenize a batch of texts in a single regex pass and return one list of alphabetic tokens per text.
+
+    Only the tokens `clean_text` keeps are produced, following the rules of NLTK's word_tokenize and an
+    `isalpha()` filter, with Punkt's sentence splitting approximated: curly apostrophes split words
+    ('don’t' -> 'don', 't'), a sentence-final period is split off unless the whole word is an abbreviation,
+    and tokens with digits, internal periods or hyphens are dropped.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    batches = [[]]
+    joined = '\0'.join(texts)
+    matches = list(_TOKEN_PATTERN.finditer(joined))
+    last = len(matches) - 1
+    for i, match in enumerate(matches):
+        token = match.group()
+        if token == '\0':
+            batches.append([])  # Start of the next text
+            continue
+        words = batches[-1]
+        if token.isalpha():
+            _append_word(words, token)
+            continue
+        if token[-1] == '.':
+            token = token[:-1]
+            # A whole-word abbreviation keeps its period, and is dropped, unless it ends the text
+            start = match.start()
+            whole_word = start == 0 or joined[start - 1].isspace() or joined[start - 1] in _PUNKT_WORD_BOUNDARY
+            if (whole_word and token.isalpha() and (len(token) == 1 or token.casefold() in PUNKT_ABBREVIATIONS)
+                    and i < last and matches[i + 1].group() != '\0'):
+                continue
+            if token.isalpha():
+                _append_word(words, token)
+                continue
+        if "'" in token:
+            contraction = _APOSTROPHE_PATTERN.fullmatch(token)
+            if contraction:
+                _append_word(words, contraction.group(1))
+    return batches
+
+
+def regex_tokenize(text):
+    """Tokenize a single text with the regex tokenizer."""
+    return regex_tokenize_batch([text])[0]
+
+
+def tokenize_batch(texts, tokenizer='nltk'):
+    """Tokenize a batch of texts with the selected backend ('nltk' or 'regex'); return one token list per text."""
+    if tokenizer == 'regex':
+        return regex_tokenize_batch(texts)
+    if tokenizer != 'nltk':
+        raise ValueError(f"unknown tokenizer {tokenizer!r}; expected one of {', '.join(TOKENIZERS)}")
+    word_tokenize = _word_tokenizer()
+    return [word_tokenize(text) for text in texts]
+
+
+def load_stopword_list(path, encoding='utf-8'):
+    """Read a custom stopword list: one word per line, blank lines and '#' comments ignored."""
+    words = []
+    with open(path, 'r', encoding=encoding) as f:
+        for line in f:
+            word = line.split('#', 1)[0].strip()
+            if word:
+                words.append(word)
+    return words
+
+
+class StopwordFilter:
+    """A stopword set built once and shared by every call to `clean_text`.
+
+    Words are case-folded when the filter is built, so membership checks are a
+    single lookup in a frozen set.
+    """
+
+    def __init__(self, custom_stopwords=CUSTOM_STOPWORDS, language='english', include_nltk=True):
+        words = set()
+        if include_nltk:
+            ensure_nltk_resources(['stopwords'])
+            from nltk.corpus import stopwords  # Imported lazily: importing NLTK takes over a second
+
+            words.update(stopwords.words(language))  # Initialize stopwords from NLTK
+        words.update(custom_stopwords)
+        self.language = language
+        self.words = frozenset(word.casefold() for word in words)
+
+    @classmethod
+    def from_files(cls, paths, language='english', include_nltk=True, extend_defaults=True):
+        """Build a filter from one or more custom stopword list files for a corpus."""
+        if isinstance(paths, str):
+            paths = [paths]
+        custom = list(CUSTOM_STOPWORDS) if extend_defaults else []
+        for path in paths:
+            custom.extend(load_stopword_list(path))
+        return cls(custom, language=language, include_nltk=include_nltk)
+
+    def fingerprint(self):
+        """Return a hash of the stopword set, used to key cached cleaning results."""
+        return hashlib.sha256('\n'.join(sorted(self.words)).encode('utf-8')).hexdigest()
+
+    def __contains__(self, word):
+        return word.casefold() in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def filter(self, tokens):
+        """Keep the alphabetic tokens that are not stopwords."""
+        words = self.words
+        return [token for token in tokens if token.isalpha() and token.casefold() not in words]
+
+
+@functools.lru_cache(maxsize=None)
+def default_stopword_filter():
+    """Return the shared filter built from the NLTK English list and `CUSTOM_STOPWORDS`."""
+    return StopwordFilter()
+
+
+def clean_text(text, stopword_filter=None, tokenizer='nltk'):
+    """Clean the input text by removing stopwords and punctuation."""
+    return clean_texts([text], stopword_filter, tokenizer)[0]
+
+
+def clean_texts(texts, stopword_filter=None, tokenizer='nltk'):
+    """Clean a batch of texts, tokenizing them in one call to the selected tokenizer."""
+    if stopword_filter is None:
+        stopword_filter = default_stopword_filter()
+
+    # Tokenize the texts into words, remove punctuation and stopwords, and join the cleaned words back into strings
+    return [' '.join(stopword_filter.filter(words)) for words in tokenize_batch(texts, tokenizer)]
+
+
+_worker_filter = None  # The stopword filter of a pool worker process, set once by `_init_worker`
+_worker_tokenizer = 'nltk'
+
+
+def _init_worker(stopword_filter, tokenizer='nltk'):
+    global _worker_filter, _worker_tokenizer
+    _worker_filter = stopword_filter
+    _worker_tokenizer = tokenizer
+
+
+def _clean_batch(statements):
+    return clean_texts(statements, _worker_filter, _worker_tokenizer)
+
+
+def cleaning_pool(stopword_filter, workers=0, tokenizer='nltk'):
+    """Return a process pool of statement cleaners to reuse across `clean_statements` calls.
+
+    Its workers clean with `stopword_filter` and `tokenizer`; `workers=0` uses every available core.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stopword_filter, tokenizer))
+
+
+def clean_statements(statements, stopword_filter=None, workers=1, batch_size=16, tokenizer='nltk', executor=None):
+    """Clean a sequence of statements, optionally across a pool of worker processes.
+
+    With `workers` greater than 1 the statements are split into batches of `batch_size`
+    and cleaned by a `ProcessPoolExecutor`; `workers=0` uses every available core.
+    An `executor` from `cleaning_pool` is used instead of starting a pool for this call.
+    The cleaned statements are always returned in input order.
+    """
+    if stopword_filter is None:
+        stopword_filter = default_stopword_filter()
+    statements = list(statements)
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if (workers <= 1 and executor is None) or len(statements) <= batch_size:
+        return clean_texts(statements, stopword_filter, tokenizer)
+
+    batches = [statements[i:i + batch_size] for i in range(0, len(statements), batch_size)]
+    if executor is not None:
+        return [statement for batch in executor.map(_clean_batch, batches) for statement in batch]
+    cleaned = []
+    with cleaning_pool(stopword_filter, workers, tokenizer) as executor:
+        for batch in executor.map(_clean_batch, batches):  # map() yields results in submission order
+            cleaned.extend(batch)
+
+    return cleaned
+
+
+def clean_turns(turns, stopword_filter=None, tokenizer='nltk'):
+    """Clean the statements of (speaker, statement) turns and return a list of (speaker, cleaned statement)."""
+    turns = list(turns)
+    cleaned = clean_texts([statement for _, statement in turns], stopword_filter, tokenizer)
+    return [(speaker, statement) for (speaker, _), statement in zip(turns, cleaned)]
@@ -0,0 +1,124 @@
+"""Compact columnar export of cleaned turns: token ids plus per-turn offset and metadata columns.
+
+A columnar directory holds flat little-endian binary columns that can be memory-mapped with NumPy:
+
+- ``tokens.bin``      int32 token ids of every turn, concatenated in turn order
+- ``offsets.bin``     int64, n_turns + 1 entries; turn i is ``tokens[offsets[i]:offsets[i + 1]]``
+- ``debate.bin``      int32 index into ``debates.json`` for each turn
+- ``turn_index.bin``  int32 position of each turn within its debate
+- ``speaker.bin``     int32 index into ``speakers.json`` for each turn
+- ``vocab.json``      the term of each token id
+- ``meta.json``       format version, dtypes and row counts
+"""
+
+import json
+import os
+
+import numpy as np
+
+from debate_analysis.matrix import Vocabulary
+
+FORMAT_VERSION = 1
+COLUMNS = {'tokens': '<i4', 'offsets': '<i8', 'debate': '<i4', 'turn_index': '<i4', 'speaker': '<i4'}
+
+
+class ColumnarWriter:
+    """Stream cleaned turns into a columnar directory; token ids are written as each turn arrives."""
+
+    def __init__(self, directory, vocabulary=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.debates = []
+        self.speakers = Vocabulary()  # Speaker names interned the same way as terms
+        self.n_tokens = 0
+        self.offsets = [0]
+        self.turn_debates, self.turn_indexes, self.turn_speakers = [], [], []
+        self.tokens_file = open(self._path('tokens'), 'wb')
+
+    def _path(self, column):
+        return os.path.join(self.directory, f"{column}.bin")
+
+    def add_turns(self, debate_id, cleaned_turns):
+        """Append the cleaned (speaker, statement) turns of one debate, keeping their order."""
+        debate = len(self.debates)
+        self.debates.append(debate_id)
+        for turn_index, (speaker, statement) in enumerate(cleaned_turns):
+            ids = self.vocabulary.encode(statement.split())
+            ids.astype(COLUMNS['tokens'], copy=False).tofile(self.tokens_file)
+            self.n_tokens += len(ids)
+            self.offsets.append(self.n_tokens)
+            self.turn_debates.append(debate)
+            self.turn_indexes.append(turn_index)
+            self.turn_speakers.append(self.speakers.add(speaker))
+
+    def close(self):
+        """Write the turn columns and metadata; the directory is complete once this returns."""
+        self.tokens_file.close()
+        columns = {'offsets': self.offsets, 'debate': self.turn_debates, 'turn_index': self.turn_indexes,
+                   'speaker': self.turn_speakers}
+        for column, values in columns.items():
+            np.asarray(values, dtype=COLUMNS[column]).tofile(self._path(column))
+
+        with open(os.path.join(self.directory, 'vocab.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.vocabulary.terms, f, ensure_ascii=False)
+        with open(os.path.join(self.directory, 'debates.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.debates, f, ensure_ascii=False)
+        with open(os.path.join(self.directory, 'speakers.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.speakers.terms, f, ensure_ascii=False)
+        meta = {'format_version': FORMAT_VERSION, 'columns': COLUMNS, 'n_turns': len(self.turn_speakers),
+                'n_tokens': self.n_tokens}
+        with open(os.path.join(self.directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.tokens_file.close()
+
+
+class ColumnarTranscripts:
+    """Read-only, memory-mapped view of a columnar directory written by `ColumnarWriter`."""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar format version {self.meta['format_version']} in '{directory}'")
+
+        self.directory = directory
+        self.columns = {column: self._map(column, dtype) for column, dtype in self.meta['columns'].items()}
+        self.tokens = self.columns['tokens']
+        self.offsets = self.columns['offsets']
+        with open(os.path.join(directory, 'vocab.json'), 'r', encoding='utf-8') as f:
+            self.vocabulary = Vocabulary(json.load(f))
+        with open(os.path.join(directory, 'debates.json'), 'r', encoding='utf-8') as f:
+            self.debates = json.load(f)
+        with open(os.path.join(directory, 'speakers.json'), 'r', encoding='utf-8') as f:
+            self.speakers = json.load(f)
+
+    def _map(self, column, dtype):
+        path = os.path.join(self.directory, f"{column}.bin")
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)  # np.memmap cannot map an empty file
+        return np.memmap(path, dtype=dtype, mode='r')
+
+    def __len__(self):
+        return self.meta['n_turns']
+
+    def turn_tokens(self, turn):
+        """Return a turn's token ids as a zero-copy slice of the mapped token column."""
+        return self.tokens[self.offsets[turn]:self.offsets[turn + 1]]
+
+    def turn(self, turn):
+        """Return (debate id, turn index, speaker, terms) of a turn."""
+        return (self.debates[self.columns['debate'][turn]], int(self.columns['turn_index'][turn]),
+                self.speakers[self.columns['speaker'][turn]], self.vocabulary.decode(self.turn_tokens(turn)))
+
+    def iter_turns(self):
+        for turn in range(len(self)):
+            yield self.turn(turn)
@@ -0,0 +1,245 @@
+"""Precomputed per-speaker summaries of processed debates and vectorized comparison queries over them.
+
+Query a saved summary directory with, e.g.:
+
+    python -m debate_analysis.compare summaries/ shifts TRUMP BIDEN
+    python -m debate_analysis.compare summaries/ similarity
+    python -m debate_analysis.compare summaries/ unique CNN_raw_transcript:TRUMP
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from debate_analysis.matrix import Vocabulary, count_matrix_from_counters
+
+VOCABULARY_FILE = 'vocab.json'
+COUNTS_FILE = 'counts.npz'
+SUMMARIES_FILE = 'summaries.json'
+
+
+def parse_label(text):
+    """Parse a command-line label: 'DEBATE:SPEAKER', 'SPEAKER' (every debate) or 'DEBATE:' (every speaker)."""
+    if ':' not in text:
+        return text
+    debate_id, speaker = text.rsplit(':', 1)
+    return debate_id, speaker or None
+
+
+class SpeakerSummaries:
+    """Compact summaries of every (debate, speaker) pair: word totals, top-k terms and a sparse count vector.
+
+    Rows of one CSR matrix over a shared vocabulary hold the counts; relative frequency vectors are those
+    rows divided by their totals. Queries take a label, which is a (debate_id, speaker) pair, a speaker
+    name (summed over every debate) or (debate_id, None) (every speaker of a debate), and are answered
+    from the summaries alone, without the source transcripts.
+    """
+
+    def __init__(self, top_k=50, vocabulary=None):
+        self.top_k = top_k
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.labels = []  # (debate_id, speaker) of each row
+        self.matrix = sparse.csr_matrix((0, len(self.vocabulary)), dtype=np.int64)
+        self.totals = np.zeros(0, dtype=np.int64)
+        self.top_terms = {}  # (debate_id, speaker) -> [(term, count), ...]
+
+    def __len__(self):
+        return len(self.labels)
+
+    def debates(self):
+        return list(dict.fromkeys(debate_id for debate_id, _ in self.labels))
+
+    def add_counts(self, debate_id, speaker_counts):
+        """Summarize a debate from {speaker: {term: count}}, replacing any earlier summary of the same debate."""
+        self.remove_debate(debate_id)
+        count_matrix = count_matrix_from_counters({speaker: counts for speaker, counts in speaker_counts.items() if counts},
+                                                  self.vocabulary)
+        speakers, block = count_matrix.labels, count_matrix.matrix.astype(np.int64)
+        size = len(self.vocabulary)
+
+        self.matrix.resize((self.matrix.shape[0], size))  # The vocabulary may have grown
+        self.matrix = sparse.vstack([self.matrix, block], format='csr')
+        self.totals = np.concatenate([self.totals, np.asarray(block.sum(axis=1)).ravel()])
+        for row, speaker in enumerate(speakers):
+            label = (debate_id, speaker)
+            self.labels.append(label)
+            self.top_terms[label] = self._top_k(block.getrow(row))
+
+    def add_document(self, debate_id, cleaned_turns):
+        """Summarize a debate from its cleaned (speaker, statement) turns, as yielded while segregating."""
+        speaker_counts = {}
+        for speaker, statement in cleaned_turns:
+            speaker_counts.setdefault(speaker, Counter()).update(statement.split())
+        self.add_counts(debate_id, speaker_counts)
+
+    def remove_debate(self, debate_id):
+        keep = [row for row, (debate, _) in enumerate(self.labels) if debate != debate_id]
+        if len(keep) == len(self.labels):
+            return
+        for label in self.labels:
+            if label[0] == debate_id:
+                del self.top_terms[label]
+        self.matrix = self.matrix[keep]
+        self.totals = self.totals[keep]
+        self.labels = [self.labels[row] for row in keep]
+
+    def _top_k(self, row):
+        top = np.lexsort((row.indices, -row.data))[:self.top_k]  # Sort by count, then by term id for stable ties
+        return [(self.vocabulary.terms[row.indices[i]], int(row.data[i])) for i in top]
+
+    def _rows(self, label):
+        """Row numbers of a label: one (debate, speaker) row, or every row of a speaker or a debate."""
+        if isinstance(label, tuple) and label[1] is not None:
+            rows = [row for row, row_label in enumerate(self.labels) if row_label == tuple(label)]
+        elif isinstance(label, tuple):
+            rows = [row for row, (debate_id, _) in enumerate(self.labels) if debate_id == label[0]]
+        else:
+            rows = [row for row, (_, speaker) in enumerate(self.labels) if speaker == label]
+        if not rows:
+            raise KeyError(f"No summary for {label!r}")
+        return rows
+
+    def counts(self, label):
+        """A label's dense count vector over the vocabulary."""
+        return np.asarray(self.matrix[self._rows(label)].sum(axis=0)).ravel()
+
+    def frequencies(self, label):
+        """A label's relative frequency vector (sums to 1)."""
+        counts = self.counts(label)
+        return counts / max(counts.sum(), 1)
+
+    def total(self, label):
+        return int(self.totals[self._rows(label)].sum())
+
+    def top(self, label, k=10):
+        """A label's k most frequent (term, count) pairs; precomputed for single (debate, speaker) labels."""
+        if isinstance(label, tuple) and label[1] is not None and k <= self.top_k:
+            return self.top_terms[tuple(label)][:k]
+        counts = self.counts(label)
+        nonzero = np.flatnonzero(counts)
+        top = nonzero[np.lexsort((nonzero, -counts[nonzero]))][:k]
+        return [(self.vocabulary.terms[i], int(counts[i])) for i in top]
+
+    def shifts(self, label_a, label_b, k=10):
+        """The terms whose relative frequency changed most from `label_a` to `label_b`.
+
+        Returns (term, frequency in a, frequency in b, change) tuples, largest absolute change first.
+        """
+        freq_a, freq_b = self.frequencies(label_a), self.frequencies(label_b)
+        delta = freq_b - freq_a
+        order = np.lexsort((np.arange(len(delta)), -np.abs(delta)))[:k]
+        return [(self.vocabulary.terms[i], float(freq_a[i]), float(freq_b[i]), float(delta[i])) for i in order if delta[i]]
+
+    def similarity(self, label_a=None, label_b=None):
+        """Cosine similarity of two labels' frequency vectors, or of every pair of rows when no labels are given.
+
+        Without labels, returns (labels, similarity matrix).
+        """
+        if label_a is not None:
+            a, b = self.counts(label_a).astype(np.float64), self.counts(label_b).astype(np.float64)
+            norm = np.linalg.norm(a) * np.linalg.norm(b)
+            return float(a @ b / norm) if norm else 0.0
+        norms = np.sqrt(np.asarray(self.matrix.multiply(self.matrix).sum(axis=1)).ravel()).astype(np.float64)
+        norms[norms == 0] = 1.0
+        unit = sparse.diags(1.0 / norms) @ self.matrix
+        return list(self.labels), (unit @ unit.T).toarray()
+
+    def unique_terms(self, label, others=None, min_count=2, k=20):
+        """Terms a label used at least `min_count` times that none of the `others` used at all.
+
+        `others` defaults to every other speaker of the same debate for a (debate, speaker) label,
+        and to every other row otherwise. Returns (term, count) pairs, most frequent first.
+        """
+        rows = set(self._rows(label))
+        if others is None:
+            if isinstance(label, tuple) and label[1] is not None:
+                other_rows = [row for row in self._rows((label[0], None)) if row not in rows]
+            else:
+                other_rows = [row for row in range(len(self.labels)) if row not in rows]
+        else:
+            other_rows = sorted({row for other in others for row in self._rows(other)} - rows)
+        counts = self.counts(label)
+        used_by_others = np.asarray(self.matrix[other_rows].sum(axis=0)).ravel() if other_rows else np.zeros_like(counts)
+        unique = np.flatnonzero((counts >= min_count) & (used_by_others == 0))
+        top = unique[np.lexsort((unique, -counts[unique]))][:k]
+        return [(self.vocabulary.terms[i], int(counts[i])) for i in top]
+
+    def save(self, directory):
+        """Write the summaries to a directory: vocabulary, sparse counts and a JSON index of labels and top terms."""
+        os.makedirs(directory, exist_ok=True)
+        self.matrix.resize((self.matrix.shape[0], len(self.vocabulary)))
+        self.vocabulary.save(os.path.join(directory, VOCABULARY_FILE))
+        sparse.save_npz(os.path.join(directory, COUNTS_FILE), self.matrix)
+        with open(os.path.join(directory, SUMMARIES_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'top_k': self.top_k,
+                       'rows': [{'debate_id': debate_id, 'speaker': speaker, 'total': int(total),
+                                 'top_terms': self.top_terms[(debate_id, speaker)]}
+                                for (debate_id, speaker), total in zip(self.labels, self.totals)]},
+                      f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, SUMMARIES_FILE), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        summaries = cls(top_k=data['top_k'], vocabulary=Vocabulary.load(os.path.join(directory, VOCABULARY_FILE)))
+        summaries.matrix = sparse.load_npz(os.path.join(directory, COUNTS_FILE)).tocsr()
+        summaries.labels = [(row['debate_id'], row['speaker']) for row in data['rows']]
+        summaries.totals = np.array([row['total'] for row in data['rows']], dtype=np.int64)
+        summaries.top_terms = {(row['debate_id'], row['speaker']): [tuple(pair) for pair in row['top_terms']]
+                               for row in data['rows']}
+        return summaries
+
+    @classmethod
+    def load_or_create(cls, directory, top_k=50):
+        if os.path.exists(os.path.join(directory, SUMMARIES_FILE)):
+            return cls.load(directory)
+        return cls(top_k=top_k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare speakers and debates from precomputed summaries.")
+    parser.add_argument('summaries', help="summary directory written with --summaries")
+    parser.add_argument('query', choices=['list', 'top', 'shifts', 'similarity', 'unique'])
+    parser.add_argument('labels', nargs='*',
+                        help="DEBATE:SPEAKER, SPEAKER (all debates) or DEBATE: (all speakers); shifts and similarity take two")
+    parser.add_argument('-k', type=int, default=10, help="number of terms to show (default: 10)")
+    parser.add_argument('--min-count', type=int, default=2, help="minimum uses of a unique term (default: 2)")
+    args = parser.parse_args()
+
+    summaries = SpeakerSummaries.load(args.summaries)
+    labels = [parse_label(label) for label in args.labels]
+    needed = {'top': 1, 'unique': 1, 'shifts': 2}.get(args.query, 0)
+    if len(labels) < needed or (args.query == 'similarity' and len(labels) not in (0, 2)):
+        parser.error(f"'{args.query}' needs {needed or 'zero or two'} labels")
+
+    try:
+        if args.query == 'list':
+            for (debate_id, speaker), total in zip(summaries.labels, summaries.totals):
+                print(f"{debate_id}:{speaker}\t{total} words")
+        elif args.query == 'top':
+            for term, count in summaries.top(labels[0], args.k):
+                print(f"{term}: {count}")
+        elif args.query == 'shifts':
+            for term, freq_a, freq_b, delta in summaries.shifts(labels[0], labels[1], args.k):
+                print(f"{term}: {freq_a:.2%} -> {freq_b:.2%} ({delta:+.2%})")
+        elif args.query == 'similarity' and labels:
+            print(f"{summaries.similarity(labels[0], labels[1]):.3f}")
+        elif args.query == 'similarity':
+            row_labels, similarities = summaries.similarity()
+            names = [f"{debate_id}:{speaker}" for debate_id, speaker in row_labels]
+            for name, row in zip(names, similarities):
+                print(name + '\t' + ' '.join(f"{value:.2f}" for value in row))
+        else:
+            others = labels[1:] or None
+            for term, count in summaries.unique_terms(labels[0], others, min_count=args.min_count, k=args.k):
+                print(f"{term}: {count}")
+    except KeyError as error:
+        parser.exit(1, f"{error.args[0]}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""Term co-occurrence within a token window, counted into a sparse symmetric matrix and exported as a graph.
+
+Pairs are buffered as id arrays and folded into the sparse matrix one chunk at a time, so memory is
+bounded by the number of distinct pairs plus one chunk, however many debates are counted.
+"""
+
+import json
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+from scipy import sparse
+
+from debate_analysis.matrix import Vocabulary
+
+GRAPH_FORMATS = ('graphml', 'json', 'csv')
+
+
+class CooccurrenceCounter:
+    """Counts of unordered term pairs occurring at most `window` tokens apart within a turn.
+
+    The matrix keeps each pair once in its upper triangle (row id < column id); `pair_matrix()`
+    returns the full symmetric matrix. Buffered pairs are merged into it whenever more than
+    `chunk_size` are pending. Windows never span two turns.
+    """
+
+    def __init__(self, window=5, chunk_size=1 << 20, vocabulary=None):
+        self.window = window
+        self.chunk_size = chunk_size
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self.term_counts = np.zeros(0, dtype=np.int64)
+        self.total_terms = 0
+        self.total_pairs = 0
+        self._pending = []  # (row ids, column ids) arrays not yet folded into the matrix
+        self._pending_pairs = 0
+        self._pending_ids = []
+
+    def update(self, tokens):
+        """Count the pairs of one turn's tokens."""
+        ids = self.vocabulary.encode(tokens)
+        self._pending_ids.append(ids)
+        self.total_terms += len(ids)
+        for offset in range(1, min(self.window, len(ids) - 1) + 1):
+            left, right = ids[:-offset], ids[offset:]
+            distinct = left != right  # A term next to itself is not a pair
+            left, right = left[distinct], right[distinct]
+            self._pending.append((np.minimum(left, right), np.maximum(left, right)))
+            self._pending_pairs += len(left)
+        if self._pending_pairs > self.chunk_size:
+            self._flush()
+
+    def update_statements(self, statements):
+        """Count the pairs of cleaned, space-separated statements, one turn each."""
+        for statement in statements:
+            self.update(statement.split())
+
+    def _flush(self):
+        """Fold the pending pairs and term ids into the matrix and the term counts."""
+        size = len(self.vocabulary)
+        if self._pending:
+            rows = np.concatenate([rows for rows, _ in self._pending])
+            cols = np.concatenate([cols for _, cols in self._pending])
+            chunk = sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(size, size))
+            self.total_pairs += len(rows)
+        else:
+            chunk = sparse.csr_matrix((size, size), dtype=np.int64)
+        self.matrix.resize((size, size))  # The vocabulary may have grown since the last chunk
+        self.matrix = self.matrix + chunk
+
+        term_counts = np.zeros(size, dtype=np.int64)
+        term_counts[:len(self.term_counts)] = self.term_counts
+        if self._pending_ids:
+            term_counts += np.bincount(np.concatenate(self._pending_ids), minlength=size)
+        self.term_counts = term_counts
+        self._pending, self._pending_ids, self._pending_pairs = [], [], 0
+
+    def merge(self, other):
+        """Add another counter's pairs (e.g. from another debate or worker), remapping its term ids onto ours."""
+        if other.window != self.window:
+            raise ValueError("Only counters with the same window can be merged")
+        self._flush()
+        other._flush()
+        id_map = self.vocabulary.encode(other.vocabulary.terms)
+        self._flush()  # Size the matrix for any terms that are new to this vocabulary
+        upper = other.matrix.tocoo()
+        rows, cols = id_map[upper.row], id_map[upper.col]
+        size = len(self.vocabulary)
+        self.matrix = self.matrix + sparse.csr_matrix((upper.data, (np.minimum(rows, cols), np.maximum(rows, cols))),
+                                                      shape=(size, size))
+        np.add.at(self.term_counts, id_map, other.term_counts)
+        self.total_terms += other.total_terms
+        self.total_pairs += other.total_pairs
+        return self
+
+    def pair_matrix(self):
+        """Return the symmetric term-by-term co-occurrence matrix (CSR)."""
+        self._flush()
+        return (self.matrix + self.matrix.T).tocsr()
+
+    def count(self, term_a, term_b):
+        self._flush()
+        a, b = self.vocabulary.get(term_a), self.vocabulary.get(term_b)
+        if a is None or b is None or a == b:
+            return 0
+        return int(self.matrix[min(a, b), max(a, b)])
+
+    def top_pairs(self, k=20, measure='pmi', min_count=3):
+        """Rank term pairs by how much more often they co-occur than by chance.
+
+        `measure` is 'pmi' (pointwise mutual information), 't' (t-score, which favours frequent
+        pairs) or 'count'. Pairs seen fewer than `min_count` times are skipped, as PMI overrates rare ones.
+        Returns (term, term, count, score) tuples, highest score first.
+        """
+        self._flush()
+        upper = self.matrix.tocoo()
+        keep = upper.data >= min_count
+        rows, cols, counts = upper.row[keep], upper.col[keep], upper.data[keep].astype(np.float64)
+        if not len(counts):
+            return []
+
+        # Expected count of an unordered pair if its terms were placed independently
+        probabilities = self.term_counts / max(self.total_terms, 1)
+        expected = 2 * self.total_pairs * probabilities[rows] * probabilities[cols]
+        if measure == 'pmi':
+            scores = np.log2(counts / expected)
+        elif measure == 't':
+            scores = (counts - expected) / np.sqrt(counts)
+        elif measure == 'count':
+            scores = counts
+        else:
+            raise ValueError(f"Unknown co-occurrence measure '{measure}', expected 'pmi', 't' or 'count'")
+
+        order = np.lexsort((cols, rows, -scores))[:k]  # Highest score first, ties by term ids
+        terms = self.vocabulary.terms
+        return [(terms[rows[i]], terms[cols[i]], int(counts[i]), float(scores[i])) for i in order]
+
+    def neighbors(self, term, k=10, measure='pmi', min_count=3):
+        """Return the terms most strongly linked to `term`, as (term, count, score) tuples."""
+        pairs = self.top_pairs(k=None, measure=measure, min_count=min_count)
+        linked = [(b if a == term else a, count, score) for a, b, count, score in pairs if term in (a, b)]
+        return linked[:k]
+
+    def write_graph(self, path, k=200, measure='pmi', min_count=3):
+        """Export the `k` strongest pairs as a weighted graph: GraphML (Gephi, networkx), JSON node-link or CSV edges.
+
+        The format follows the file extension. Nodes carry their term counts, edges their co-occurrence
+        count and score.
+        """
+        fmt = path.rsplit('.', 1)[-1].lower()
+        if fmt not in GRAPH_FORMATS:
+            raise ValueError(f"Unsupported graph format '{fmt}', expected one of {GRAPH_FORMATS}")
+        edges = self.top_pairs(k=k, measure=measure, min_count=min_count)
+        nodes = sorted({term for a, b, _, _ in edges for term in (a, b)})
+        term_counts = {term: int(self.term_counts[self.vocabulary.get(term)]) for term in nodes}
+
+        with open(path, 'w', encoding='utf-8') as f:
+            if fmt == 'json':
+                json.dump({'nodes': [{'id': term, 'count': term_counts[term]} for term in nodes],
+                           'links': [{'source': a, 'target': b, 'count': count, 'score': score}
+                                     for a, b, count, score in edges]}, f, ensure_ascii=False, indent=1)
+            elif fmt == 'csv':
+                f.write(f"source,target,count,{measure}\n")
+                for a, b, count, score in edges:
+                    f.write(f"{a},{b},{count},{score:.4f}\n")
+            else:
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+                        '  <key id="count" for="node" attr.name="count" attr.type="int"/>\n'
+                        '  <key id="weight" for="edge" attr.name="count" attr.type="int"/>\n'
+                        f'  <key id="score" for="edge" attr.name="{measure}" attr.type="double"/>\n'
+                        '  <graph edgedefault="undirected">\n')
+                for term in nodes:
+                    f.write(f'    <node id={quoteattr(term)}><data key="count">{term_counts[term]}</data></node>\n')
+                for a, b, count, score in edges:
+                    f.write(f'    <edge source={quoteattr(a)} target={quoteattr(b)}><data key="weight">{count}</data>'
+                            f'<data key="score">{score:.6f}</data></edge>\n')
+                f.write('  </graph>\n</graphml>\n')
+        return path
+
+
+def cooccurrence_analysis(speaker_statements, window=5):
+    """Count the term co-occurrences in the cleaned statements of a speaker."""
+    counter = CooccurrenceCounter(window=window)
+    counter.update_statements(speaker_statements)
+    return counter
@@ -0,0 +1,359 @@
+"""Batch processing of a transcript archive: ingest, clean, count and render jobs with bounded concurrency.
+
+Run as `python -m debate_analysis.corpus ARCHIVE_DIR --output-dir WordClouds --summary run_summary.json`.
+"""
+
+import argparse
+import json
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from debate_analysis.cleaning import TOKENIZERS, StopwordFilter, clean_turns, default_stopword_filter
+from debate_analysis.frequency import FrequencyStore
+from debate_analysis.ingest import (SPEAKERS, debate_id_for, duplicate_debate_ids, file_fingerprint, find_transcript_files,
+                                    read_transcript_lines, segment_turns)
+from debate_analysis.resources import ensure_nltk_resources
+from debate_analysis.speakers import SpeakerMatcher
+
+# The stages of every job, in order, with the pool that runs them: file reads go to a thread pool,
+# tokenizing, counting and rendering to a process pool
+JOB_STAGES = (('ingest', 'io'), ('clean', 'cpu'), ('count', 'cpu'), ('render', 'cpu'))
+
+
+def read_manifest(path):
+    """Read a manifest of transcript paths: one per line, blank lines and '#' comments ignored.
+
+    Relative paths are resolved against the manifest's directory.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    paths = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = line.split('#', 1)[0].strip()
+            if entry:
+                paths.append(os.path.join(base, entry))
+    return paths
+
+
+def _timed(function, *args):
+    """Run a stage function in its pool and return (seconds spent running it, result), excluding queueing time."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def _ignore_interrupts():
+    """Pool initializer: leave Ctrl-C to the scheduler, which stops the run, instead of killing the workers mid-job."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _ingest(path):
+    return list(read_transcript_lines(path)), file_fingerprint(path)
+
+
+_normalizers = {}  # (method, stopword fingerprint) -> Normalizer of a worker process, so its memo cache is reused
+
+
+def _clean(lines, matcher, stopword_filter, tokenizer, normalize):
+    cleaned_turns = clean_turns(segment_turns(lines, matcher), stopword_filter, tokenizer)
+    if normalize:
+        key = (normalize, stopword_filter.fingerprint())
+        if key not in _normalizers:
+            from debate_analysis.normalize import Normalizer
+
+            _normalizers[key] = Normalizer(normalize, stopword_filter=stopword_filter)
+        cleaned_turns = _normalizers[key].normalize_turns(cleaned_turns)
+    return cleaned_turns
+
+
+def _count(cleaned_turns):
+    store = FrequencyStore()
+    for speaker, statement in cleaned_turns:
+        store.update(speaker, statement.split())
+    return store
+
+
+def _render(store, debate_id, output_dir, fmt, options):
+    from debate_analysis.render import render_word_clouds  # Imported lazily: imports matplotlib
+
+    speaker_weights = {(debate_id, speaker): store.word_counts(speaker) for speaker in store.speakers()}
+    return sorted(render_word_clouds(speaker_weights, output_dir, fmt, **options).values())
+
+
+class CorpusJob:
+    """The state of one transcript as it moves through the job stages."""
+
+    def __init__(self, path):
+        self.path = path
+        self.debate_id = debate_id_for(path)
+        self.stage = 0  # Index into JOB_STAGES of the stage running or next to run
+        self.attempts = 0  # Attempts of the current stage
+        self.retries = 0
+        self.status = 'pending'
+        self.error = None
+        self.seconds = {}  # Stage -> seconds its successful attempt ran, not counting time queued for a worker
+        self.lines = self.fingerprint = self.cleaned_turns = self.store = None
+        self.turns = self.tokens = 0  # Totals kept once the cleaned turns and counts are released
+        self.outputs = []
+
+    def release(self):
+        """Drop the job's transcript data, keeping only its totals and outputs."""
+        self.lines = self.cleaned_turns = self.store = None
+
+    def summary(self):
+        return {'path': self.path, 'debate_id': self.debate_id, 'status': self.status, 'error': self.error,
+                'retries': self.retries, 'fingerprint': self.fingerprint, 'seconds': self.seconds,
+                'turns': self.turns, 'tokens': self.tokens, 'outputs': self.outputs}
+
+
+class CorpusRunner:
+    """Schedule ingest -> clean -> count -> render jobs for many transcripts.
+
+    At most `max_jobs` transcripts are in flight at once, and a job's lines, cleaned turns and counts are
+    released as soon as it finishes, after `on_done` (if given) has been called with it to merge its counts,
+    so memory stays bounded however large the archive. Debate ids must be unique. Ingestion runs in a pool of `io_workers` threads and the other stages in a pool of `cpu_workers`
+    processes (every core by default). A failed stage is retried up to `retries` times before its job is
+    marked as failed; the other jobs carry on. Without `output_dir` the render stage is skipped.
+    `progress` is called with a line of text whenever a job finishes a stage, is retried or fails.
+    """
+
+    def __init__(self, output_dir=None, fmt='png', matcher=None, stopword_filter=None, tokenizer='nltk',
+                 normalize=None, max_jobs=4, io_workers=4, cpu_workers=None, retries=2, progress=print,
+                 on_done=None, **render_options):
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.matcher = matcher if matcher is not None else SpeakerMatcher(SPEAKERS)
+        self.stopword_filter = stopword_filter if stopword_filter is not None else default_stopword_filter()
+        self.tokenizer = tokenizer
+        self.normalize = normalize
+        self.max_jobs = max_jobs
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.retries = retries
+        self.progress = progress
+        self.on_done = on_done
+        self.render_options = render_options
+        self.stages = JOB_STAGES if output_dir is not None else JOB_STAGES[:-1]
+
+    def _stage_call(self, job):
+        """Return the function and arguments of the job's current stage."""
+        name = self.stages[job.stage][0]
+        if name == 'ingest':
+            return _ingest, (job.path,)
+        if name == 'clean':
+            return _clean, (job.lines, self.matcher, self.stopword_filter, self.tokenizer, self.normalize)
+        if name == 'count':
+            return _count, (job.cleaned_turns,)
+        return _render, (job.store, job.debate_id, self.output_dir, self.fmt, self.render_options)
+
+    def _finish_stage(self, job, result):
+        name = self.stages[job.stage][0]
+        if name == 'ingest':
+            job.lines, job.fingerprint = result
+        elif name == 'clean':
+            job.cleaned_turns, job.lines = result, None  # The raw lines are no longer needed
+            job.turns = len(result)
+        elif name == 'count':
+            job.store, job.cleaned_turns = result, None  # Nor are the cleaned turns, once counted
+            job.tokens = result.total()
+        else:
+            job.outputs = result
+
+    def run(self, paths):
+        """Process every transcript and return the list of finished `CorpusJob`s, in input order.
+
+        On Ctrl-C no further stage is started; the running ones finish and KeyboardInterrupt is re-raised.
+        """
+        duplicates = duplicate_debate_ids(paths)
+        if duplicates:
+            raise ValueError(f"Transcripts share debate ids: {sorted(duplicates)}")
+        jobs = [CorpusJob(path) for path in paths]
+        pending = deque(jobs)
+        running = {}  # Future -> job; each job in flight has exactly one running stage
+        finished = 0
+
+        with ThreadPoolExecutor(max_workers=self.io_workers) as io_pool, \
+                ProcessPoolExecutor(max_workers=self.cpu_workers, initializer=_ignore_interrupts) as cpu_pool:
+            pools = {'io': io_pool, 'cpu': cpu_pool}
+
+            def submit(job):
+                function, args = self._stage_call(job)
+                job.status = 'running'
+                running[pools[self.stages[job.stage][1]].submit(_timed, function, *args)] = job
+
+            while pending or running:
+                while pending and len(running) < self.max_jobs:
+                    submit(pending.popleft())
+
+                try:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                except KeyboardInterrupt:
+                    # Stop scheduling; the stages already running finish before the pools shut down
+                    for pool in pools.values():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                for future in done:
+                    job = running.pop(future)
+                    name = self.stages[job.stage][0]
+                    try:
+                        seconds, result = future.result()
+                    except Exception as error:
+                        job.attempts += 1
+                        if job.attempts <= self.retries:
+                            job.retries += 1
+                            self.progress(f"[{finished}/{len(jobs)}] {job.debate_id}: {name} failed ({error}), "
+                                          f"retry {job.attempts}/{self.retries}")
+                            submit(job)
+                            continue
+                        job.status, job.error = 'failed', f"{name}: {error!r}"
+                        job.release()
+                        finished += 1
+                        self.progress(f"[{finished}/{len(jobs)}] {job.debate_id}: failed in {name} ({error})")
+                        continue
+
+                    job.seconds[name] = seconds
+                    self._finish_stage(job, result)
+                    job.stage += 1
+                    job.attempts = 0
+                    if job.stage < len(self.stages):
+                        submit(job)
+                        continue
+                    job.status = 'done'
+                    finished += 1
+                    if self.on_done is not None:
+                        self.on_done(job)
+                    job.release()
+                    self.progress(f"[{finished}/{len(jobs)}] {job.debate_id}: done in {sum(job.seconds.values()):.2f} s "
+                                  f"({job.turns} turns, {job.tokens} words)")
+
+        return jobs
+
+
+def run_summary(jobs, wall_seconds):
+    """Summarize a run: job outcomes, totals, per-stage seconds and every job's details."""
+    stage_seconds = {}
+    for job in jobs:
+        for name, seconds in job.seconds.items():
+            stage_seconds[name] = stage_seconds.get(name, 0.0) + seconds
+    details = [job.summary() for job in jobs]
+    return {'wall_seconds': wall_seconds, 'jobs': len(jobs),
+            'succeeded': sum(job.status == 'done' for job in jobs),
+            'failed': sum(job.status == 'failed' for job in jobs),
+            'retries': sum(job.retries for job in jobs),
+            'turns': sum(detail['turns'] for detail in details),
+            'tokens': sum(detail['tokens'] for detail in details),
+            'stage_seconds': stage_seconds, 'job_details': details}
+
+
+def write_summary(summary, path):
+    """Write a run summary as JSON, atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process an archive of debate transcripts as scheduled batch jobs.")
+    parser.add_argument('transcripts', nargs='*', help="transcript files or directories of .txt transcripts")
+    parser.add_argument('--manifest', action='append', default=[], metavar='PATH',
+                        help="file listing transcript paths, one per line (can be repeated)")
+    parser.add_argument('--output-dir', metavar='DIR', help="render one word cloud per debate and speaker to DIR")
+    parser.add_argument('--format', choices=['png', 'svg'], default='png', help="image format of saved word clouds")
+    parser.add_argument('--summary', default='run_summary.json', metavar='PATH',
+                        help="where to write the per-run summary (default: run_summary.json)")
+    parser.add_argument('--frequency-store', metavar='PATH',
+                        help="JSON file of accumulated word counts; transcripts already counted in it are skipped")
+    parser.add_argument('--summaries', metavar='DIR', help="add per-debate speaker summaries to DIR for comparisons")
+    parser.add_argument('--stopwords', action='append', default=[], help="extra stopword list file (can be repeated)")
+    parser.add_argument('--tokenizer', choices=TOKENIZERS, default='nltk', help="tokenizer backend (default: nltk)")
+    parser.add_argument('--normalize', choices=['lemma', 'stem'], help="lemmatize or stem cleaned words")
+    parser.add_argument('--all-speakers', action='store_true', help="keep every speaker tag, not only the default four")
+    parser.add_argument('--jobs', type=int, default=4, help="transcripts in flight at once (default: 4)")
+    parser.add_argument('--io-workers', type=int, default=4, help="threads reading transcripts (default: 4)")
+    parser.add_argument('--cpu-workers', type=int, help="processes cleaning, counting and rendering (default: all cores)")
+    parser.add_argument('--retries', type=int, default=2, help="retries of a failed job stage (default: 2)")
+    parser.add_argument('--checkpoint-every', type=int, default=10, metavar='N',
+                        help="save the frequency store and summaries after every N finished jobs (default: 10)")
+    args = parser.parse_args()
+
+    paths = find_transcript_files(args.transcripts)
+    for manifest in args.manifest:
+        paths.extend(read_manifest(manifest))
+    paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))  # Each transcript once, in order
+    if not paths:
+        parser.error("no transcripts given; pass files, directories or --manifest")
+    duplicates = duplicate_debate_ids(paths)
+    if duplicates:
+        # Outputs, stored counts and summaries are keyed by debate id, so one would overwrite the other
+        parser.error("transcripts with the same file name: " +
+                     "; ".join(', '.join(same) for same in duplicates.values()) + "; rename them")
+
+    # Check the NLTK data is available locally before any job starts
+    names = ['stopwords'] if args.tokenizer == 'regex' else ['tokenizer', 'stopwords']
+    if args.normalize == 'lemma':
+        names.append('wordnet')
+    try:
+        ensure_nltk_resources(names)
+    except LookupError as error:
+        parser.exit(1, f"{error}\n")
+
+    store = FrequencyStore.load_or_create(args.frequency_store) if args.frequency_store else None
+    if store is not None:
+        skipped = [path for path in paths if store.has_source(debate_id_for(path))]
+        paths = [path for path in paths if not store.has_source(debate_id_for(path))]  # Only new transcripts
+        if skipped:
+            print(f"Skipping {len(skipped)} transcripts already counted in '{args.frequency_store}'")
+
+    summaries = None
+    if args.summaries:
+        from debate_analysis.compare import SpeakerSummaries  # Imported lazily: needs NumPy/SciPy
+
+        summaries = SpeakerSummaries.load_or_create(args.summaries)
+
+    def save_counts():
+        # Summaries first: a debate recorded in the store is skipped on restart, so it must already be summarized
+        if summaries is not None:
+            summaries.save(args.summaries)
+        if store is not None:
+            store.save(args.frequency_store)
+
+    merged = []
+
+    def merge_counts(job):
+        """Fold a finished job's counts into the accumulated store and summaries before the job releases them."""
+        if store is not None:
+            store.merge(job.store)
+            store.add_source(job.debate_id, job.fingerprint)
+        if summaries is not None:
+            summaries.add_counts(job.debate_id, {speaker: job.store.word_counts(speaker) for speaker in job.store.speakers()})
+        merged.append(job.debate_id)
+        if len(merged) % max(args.checkpoint_every, 1) == 0:
+            save_counts()  # Checkpoint, so a restart after a crash skips the jobs merged so far
+
+    stopword_filter = StopwordFilter.from_files(args.stopwords) if args.stopwords else default_stopword_filter()
+    runner = CorpusRunner(args.output_dir, fmt=args.format, matcher=SpeakerMatcher(None if args.all_speakers else SPEAKERS),
+                          stopword_filter=stopword_filter, tokenizer=args.tokenizer, normalize=args.normalize,
+                          max_jobs=args.jobs, io_workers=args.io_workers, cpu_workers=args.cpu_workers,
+                          retries=args.retries, on_done=merge_counts)
+    start = time.perf_counter()
+    try:
+        jobs = runner.run(paths)
+    except KeyboardInterrupt:
+        parser.exit(130, "Interrupted: saving the counts of the finished jobs; run again to process the rest\n")
+    finally:
+        save_counts()  # Also on Ctrl-C or an error, keeping the counts of every job that finished
+    summary = run_summary(jobs, time.perf_counter() - start)
+
+    write_summary(summary, args.summary)
+    print(f"{summary['succeeded']}/{summary['jobs']} transcripts processed ({summary['failed']} failed, "
+          f"{summary['retries']} retries) in {summary['wall_seconds']:.1f} s; summary written to '{args.summary}'")
+    if summary['failed']:
+        parser.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Incremental, mergeable per-speaker word frequency counts."""
+
+import json
+import os
+from collections import Counter
+
+
+class FrequencyStore:
+    """Per-speaker word counts that grow as token streams are consumed.
+
+    Stores can be merged (e.g. partial counts from worker processes or separate debates)
+    and saved to / loaded from a JSON file, which also records the transcripts already
+    counted so later runs only need to process new ones.
+    """
+
+    def __init__(self):
+        self.counts = {}  # Speaker -> Counter of words
+        self.sources = {}  # Transcript id -> fingerprint of the counted contents
+
+    def update(self, speaker, tokens):
+        """Count an iterable of tokens for a speaker."""
+        counter = self.counts.get(speaker)
+        if counter is None:
+            counter = self.counts[speaker] = Counter()
+        counter.update(tokens)
+
+    def update_statements(self, speaker, statements):
+        """Count the words of cleaned, space-separated statements for a speaker."""
+        for statement in statements:
+            self.update(speaker, statement.split())
+
+    def merge(self, other):
+        """Add the counts and sources of another store into this one."""
+        for speaker, counter in other.counts.items():
+            self.update(speaker, counter)  # Counter.update() adds counts from a mapping
+        self.sources.update(other.sources)
+        return self
+
+    __iadd__ = merge
+
+    def add_source(self, source, fingerprint=None):
+        """Record that a transcript has been counted."""
+        self.sources[source] = fingerprint
+
+    def has_source(self, source, fingerprint=None):
+        """Check whether a transcript (optionally with the same fingerprint) has already been counted."""
+        if source not in self.sources:
+            return False
+        return fingerprint is None or self.sources[source] == fingerprint
+
+    def speakers(self):
+        return list(self.counts)
+
+    def word_counts(self, speaker):
+        """Return the Counter of a speaker's words (empty when the speaker is unknown)."""
+        return self.counts.get(speaker, Counter())
+
+    def total(self, speaker=None):
+        """Return the number of counted words for a speaker, or for every speaker."""
+        if speaker is not None:
+            return sum(self.word_counts(speaker).values())
+        return sum(sum(counter.values()) for counter in self.counts.values())
+
+    def most_common(self, speaker, n=None):
+        return self.word_counts(speaker).most_common(n)
+
+    def to_dict(self):
+        return {'counts': {speaker: dict(counter) for speaker, counter in self.counts.items()},
+                'sources': dict(self.sources)}
+
+    @classmethod
+    def from_dict(cls, data):
+        store = cls()
+        store.counts = {speaker: Counter(counts) for speaker, counts in data.get('counts', {}).items()}
+        store.sources = dict(data.get('sources', {}))
+        return store
+
+    def save(self, path):
+        """Write the store to a JSON file, replacing any previous version atomically."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a store saved with `save`."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_create(cls, path):
+        """Read a saved store, or start an empty one when the file does not exist yet."""
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls()
@@ -0,0 +1,203 @@
+"""Inverted index over speaker turns with term, phrase and boolean queries.
+
+Usage from the command line, against an index written with the script's `--index` option:
+
+    python -m debate_analysis.index debate_index.json 'inflation AND (prices OR "gas prices")' --speaker BIDEN
+"""
+
+import argparse
+import json
+import os
+import re
+
+QUERY_TOKEN = re.compile(r'\s*(?:(?P<phrase>"[^"]*")|(?P<paren>[()])|(?P<word>[^\s()"]+))')
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+class InvertedIndex:
+    """Term -> posting list of the turns (debate id, turn index, speaker) it occurs in, with token positions.
+
+    Terms are case-folded, so queries are case-insensitive. Turns are numbered in the order they are added.
+    """
+
+    def __init__(self):
+        self.turns = []  # Turn id -> (debate id, turn index, speaker)
+        self.postings = {}  # Term -> {turn id: [positions]}
+
+    def add_turn(self, debate_id, turn_index, speaker, tokens):
+        turn_id = len(self.turns)
+        self.turns.append((debate_id, turn_index, speaker))
+        for position, token in enumerate(tokens):
+            self.postings.setdefault(token.casefold(), {}).setdefault(turn_id, []).append(position)
+        return turn_id
+
+    def add_document(self, debate_id, cleaned_turns):
+        """Index the cleaned (speaker, statement) turns of one debate, in turn order, replacing any earlier copy."""
+        self.remove_debate(debate_id)
+        for turn_index, (speaker, statement) in enumerate(cleaned_turns):
+            self.add_turn(debate_id, turn_index, speaker, statement.split())
+
+    def remove_debate(self, debate_id):
+        """Drop a debate's turns; the remaining turns are renumbered in order."""
+        keep = [turn_id for turn_id, turn in enumerate(self.turns) if turn[0] != debate_id]
+        if len(keep) == len(self.turns):
+            return
+        new_ids = {turn_id: new_id for new_id, turn_id in enumerate(keep)}
+        self.turns = [self.turns[turn_id] for turn_id in keep]
+        postings = {}
+        for term, posting in self.postings.items():
+            kept = {new_ids[turn_id]: positions for turn_id, positions in posting.items() if turn_id in new_ids}
+            if kept:
+                postings[term] = kept
+        self.postings = postings
+
+    def term(self, term):
+        """Return the set of turn ids containing a term."""
+        return set(self.postings.get(term.casefold(), ()))
+
+    def phrase(self, words):
+        """Return the set of turn ids containing the words consecutively."""
+        words = [word.casefold() for word in words]
+        if not words:
+            return set()
+        postings = [self.postings.get(word, {}) for word in words]
+        candidates = set(postings[0]).intersection(*postings[1:])  # Turns containing every word
+
+        matches = set()
+        for turn_id in candidates:
+            following = [set(posting[turn_id]) for posting in postings[1:]]
+            if any(all(start + offset + 1 in positions for offset, positions in enumerate(following))
+                   for start in postings[0][turn_id]):
+                matches.add(turn_id)
+        return matches
+
+    def query(self, expression, speaker=None, debate_id=None):
+        """Evaluate a boolean query and return the matching (debate id, turn index, speaker) turns in order.
+
+        Queries combine terms and "quoted phrases" with AND, OR, NOT and parentheses; adjacent terms
+        are ANDed. Results can be restricted to one speaker and/or one debate.
+        """
+        turn_ids = _QueryParser(self, expression).parse()
+        results = [self.turns[turn_id] for turn_id in sorted(turn_ids)]
+        return [turn for turn in results
+                if (speaker is None or turn[2] == speaker) and (debate_id is None or turn[0] == debate_id)]
+
+    def to_dict(self):
+        return {'turns': self.turns,
+                'postings': {term: [[turn_id, positions] for turn_id, positions in posting.items()]
+                             for term, posting in self.postings.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.turns = [tuple(turn) for turn in data['turns']]
+        index.postings = {term: {turn_id: positions for turn_id, positions in posting}
+                          for term, posting in data['postings'].items()}
+        return index
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_create(cls, path):
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls()
+
+
+class _QueryParser:
+    """Recursive-descent parser: or_expr := and_expr (OR and_expr)*; and_expr := not_expr ([AND] not_expr)*."""
+
+    def __init__(self, index, expression):
+        self.index = index
+        self.tokens = []
+        position = 0
+        expression = expression.strip()
+        while position < len(expression):
+            m = QUERY_TOKEN.match(expression, position)
+            if m is None:
+                raise ValueError(f"Cannot parse query at: {expression[position:]!r}")
+            self.tokens.append(m.group('phrase') or m.group('paren') or m.group('word'))
+            position = m.end()
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            return set()
+        result = self.or_expr()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected '{self.peek()}' in query")
+        return result
+
+    def or_expr(self):
+        result = self.and_expr()
+        while self.peek() == 'OR':
+            self.take()
+            result |= self.and_expr()
+        return result
+
+    def and_expr(self):
+        result = self.not_expr()
+        while self.peek() not in (None, 'OR', ')'):
+            if self.peek() == 'AND':
+                self.take()
+            result &= self.not_expr()
+        return result
+
+    def not_expr(self):
+        if self.peek() == 'NOT':
+            self.take()
+            return set(range(len(self.index.turns))) - self.not_expr()
+        return self.atom()
+
+    def atom(self):
+        token = self.take()
+        if token is None or token in OPERATORS or token == ')':
+            found = 'the end of the query' if token is None else repr(token)
+            raise ValueError(f"Expected a term, phrase or '(' in query, got {found}")
+        if token == '(':
+            result = self.or_expr()
+            if self.take() != ')':
+                raise ValueError("Missing ')' in query")
+            return result
+        if token.startswith('"'):
+            return self.index.phrase(token.strip('"').split())
+        return self.index.term(token)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query an inverted index of debate turns.")
+    parser.add_argument('index', help="index file written with --index")
+    parser.add_argument('query', help="e.g. 'inflation AND prices', '\"border patrol\" OR immigration', 'NOT Trump'")
+    parser.add_argument('--speaker', help="only return turns of this speaker")
+    parser.add_argument('--debate', help="only return turns of this debate")
+    args = parser.parse_args()
+
+    index = InvertedIndex.load(args.index)
+    try:
+        results = index.query(args.query, speaker=args.speaker, debate_id=args.debate)
+    except ValueError as error:  # Malformed query, e.g. an unclosed parenthesis or a trailing operator
+        parser.exit(1, f"{error}\n")
+    for debate_id, turn_index, speaker in results:
+        print(f"{debate_id}\tturn {turn_index}\t{speaker}")
+    print(f"{len(results)} matching turns")
+
+
+if __name__ == '__main__':
+    main()
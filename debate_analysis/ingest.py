@@ -0,0 +1,96 @@
+"""Streaming ingestion of transcript files into speaker turns."""
+
+import hashlib
+import os
+
+from debate_analysis.speakers import SpeakerMatcher
+
+SPEAKERS = ['TRUMP', 'BIDEN', 'TAPPER', 'BASH']  # Default speakers from where to segregate the statements
+
+
+def find_transcript_files(paths, suffix='.txt'):
+    """Expand a list of files and directories into a sorted list of transcript files."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):  # A directory contributes every transcript file inside it
+            names = sorted(name for name in os.listdir(path) if name.endswith(suffix))
+            files.extend(os.path.join(path, name) for name in names)
+        else:
+            files.append(path)
+
+    return files
+
+
+def debate_id_for(path):
+    """Derive a debate identifier from a transcript file name."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def duplicate_debate_ids(paths):
+    """Return {debate id: paths} for ids shared by different files (e.g. '2020/debate1.txt' and '2024/debate1.txt')."""
+    seen = {}
+    for path in paths:
+        seen.setdefault(debate_id_for(path), {}).setdefault(os.path.abspath(path), path)
+    return {debate_id: list(same.values()) for debate_id, same in seen.items() if len(same) > 1}
+
+
+def read_transcript_lines(path, encoding='utf-8'):
+    """Yield the lines of a transcript file one at a time, without trailing newlines."""
+    with open(path, 'r', encoding=encoding) as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+def segment_turns(lines, matcher=None):
+    """Group an iterable of transcript lines into (speaker, statement) turns.
+
+    Each line is classified once by the speaker matcher; lines that do not open a turn belong
+    to the current one, and lines before the first speaker tag are skipped.
+    Only the lines of the turn being built are held in memory.
+    """
+    if matcher is None:
+        matcher = SpeakerMatcher(SPEAKERS)
+
+    current_speaker = None
+    current_statement = []
+
+    for line in lines:
+        matched = matcher.match(line)  # To check if the line starts with a speaker tag
+        if matched:
+            if current_speaker:
+                yield current_speaker, ' '.join(current_statement)
+
+            current_speaker, text = matched  # Set current speaker
+            current_statement = [text]  # Start a new statement
+        elif current_speaker:
+            current_statement.append(line.strip())
+
+    if current_speaker and current_statement:
+        yield current_speaker, ' '.join(current_statement)  # The last speaker's statement
+
+
+def stream_turns(paths, matcher=None, encoding='utf-8'):
+    """Yield (debate_id, speaker, statement) turns from one or many transcript files.
+
+    Files are read line by line and segmented independently, so memory use does not
+    grow with the size of the archive.
+    """
+    if matcher is None:
+        matcher = SpeakerMatcher(SPEAKERS)
+
+    for path in find_transcript_files(paths):
+        debate_id = debate_id_for(path)
+        for speaker, statement in segment_turns(read_transcript_lines(path, encoding), matcher):
+            yield debate_id, speaker, statement
+
+
+def file_fingerprint(path, chunk_size=1 << 20):
+    """Return a SHA-256 hex digest of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
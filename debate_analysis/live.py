@@ -0,0 +1,158 @@
+"""Live mode: follow a growing transcript and update speaker counts and word clouds as lines arrive."""
+
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from debate_analysis.cleaning import clean_texts, default_stopword_filter
+from debate_analysis.ingest import SPEAKERS
+from debate_analysis.profiling import NULL_INSTRUMENTATION
+from debate_analysis.speakers import SpeakerMatcher
+
+STDIN = '-'  # Source name that reads the transcript from standard input
+
+
+def follow_lines(source, poll_interval=0.1, idle_timeout=None, encoding='utf-8'):
+    """Yield batches of complete lines as they are appended to a transcript file, like `tail -f`.
+
+    The lines already in the file come first. A trailing partial line is held back until its newline
+    arrives. The file is polled every `poll_interval` seconds; following stops after `idle_timeout`
+    seconds without new lines (never by default). With `source='-'` lines are read from stdin until EOF.
+    """
+    if source == STDIN:
+        for line in sys.stdin:
+            yield [line.rstrip('\r\n')]
+        return
+
+    with open(source, 'r', encoding=encoding) as f:
+        partial = ''
+        idle_since = time.monotonic()
+        while True:
+            data = f.read()
+            if not data:
+                if os.path.getsize(source) < f.tell():  # Truncated or replaced: start over
+                    f.seek(0)
+                    partial = ''
+                    continue
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    return
+                time.sleep(poll_interval)
+                continue
+
+            lines = (partial + data).split('\n')
+            partial = lines.pop()  # Text after the last newline is an incomplete line
+            if lines:
+                idle_since = time.monotonic()
+                yield [line.rstrip('\r') for line in lines]
+
+
+class LiveDebate:
+    """Per-speaker word counts of a transcript that is still being written, updated line by line.
+
+    Lines are segmented with the speaker matcher as they arrive, and each new line is cleaned on its own
+    and added to the counts of the speaker holding the floor, so a turn is counted while it is spoken.
+    A speaker's cloud is considered stale once more than `threshold` of their top `top_k` terms differ
+    from the terms shown at their last render.
+    """
+
+    def __init__(self, matcher=None, stopword_filter=None, tokenizer='nltk', normalizer=None, top_k=10, threshold=0.2):
+        self.matcher = matcher if matcher is not None else SpeakerMatcher(SPEAKERS)
+        self.stopword_filter = stopword_filter if stopword_filter is not None else default_stopword_filter()
+        self.tokenizer = tokenizer
+        self.normalizer = normalizer
+        self.top_k = top_k
+        self.threshold = threshold
+        self.counts = {}  # Speaker -> Counter of cleaned words
+        self.current_speaker = None
+        self.rendered_terms = {}  # Speaker -> top terms at the last render
+
+    def add_lines(self, lines):
+        """Segment, clean and count new transcript lines; return the speakers whose counts changed."""
+        texts = []
+        for line in lines:
+            matched = self.matcher.match(line)  # To check if the line opens a new turn
+            if matched:
+                self.current_speaker, text = matched
+            elif self.current_speaker:
+                text = line.strip()
+            else:
+                continue  # Lines before the first speaker tag
+            texts.append((self.current_speaker, text))
+
+        changed = set()
+        cleaned = clean_texts([text for _, text in texts], self.stopword_filter, self.tokenizer)
+        for (speaker, _), statement in zip(texts, cleaned):
+            if self.normalizer is not None:
+                statement = self.normalizer.normalize_statement(statement)
+            words = statement.split()
+            if words:
+                self.counts.setdefault(speaker, Counter()).update(words)
+                changed.add(speaker)
+        return changed
+
+    def top_terms(self, speaker):
+        return [word for word, _ in self.counts.get(speaker, Counter()).most_common(self.top_k)]
+
+    def needs_render(self, speaker):
+        """Whether enough of the speaker's top terms changed since their cloud was last rendered."""
+        if speaker not in self.rendered_terms:
+            return bool(self.counts.get(speaker))
+        current = set(self.top_terms(speaker))
+        unchanged = len(current & set(self.rendered_terms[speaker]))
+        return 1 - unchanged / max(len(current), 1) > self.threshold
+
+    def mark_rendered(self, speaker):
+        self.rendered_terms[speaker] = self.top_terms(speaker)
+
+
+def run_live(source, live, output_dir=None, fmt='png', workers=1, poll_interval=0.1, idle_timeout=None,
+             instrumentation=None, **render_options):
+    """Follow `source` and keep `live` up to date, re-rendering a speaker's cloud only when their top terms changed.
+
+    Without `output_dir` the changed top terms are printed instead of rendered. With `workers` greater than 1
+    (0 for every core), the stale clouds of one update are rendered concurrently by a process pool kept for the whole session.
+    Each update reports its latency from reading the new lines to updated output.
+    Stops at the end of stdin, after `idle_timeout` or on Ctrl-C.
+    """
+    if instrumentation is None:
+        instrumentation = NULL_INSTRUMENTATION
+    executor = None
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if output_dir is not None:
+        from debate_analysis.render import render_word_cloud, word_cloud_path  # Imported lazily: imports matplotlib
+
+        os.makedirs(output_dir, exist_ok=True)
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        for lines in follow_lines(source, poll_interval, idle_timeout):
+            start = time.perf_counter()
+            with instrumentation.stage('clean', items=len(lines)):
+                changed = live.add_lines(lines)
+            stale = [speaker for speaker in sorted(changed) if live.needs_render(speaker)]
+            if output_dir is not None and stale:
+                with instrumentation.stage('render', items=len(stale)):
+                    jobs = [(dict(live.counts[speaker]), speaker, word_cloud_path(output_dir, speaker, fmt))
+                            for speaker in stale]
+                    if executor is not None:
+                        futures = [executor.submit(render_word_cloud, *job, **render_options) for job in jobs]
+                        for future in futures:
+                            future.result()
+                    else:
+                        for job in jobs:
+                            render_word_cloud(*job, **render_options)
+            latency = time.perf_counter() - start
+            for speaker in stale:
+                live.mark_rendered(speaker)
+                print(f"{speaker}: {', '.join(live.top_terms(speaker))} ({latency * 1000:.0f} ms)", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return live.counts
@@ -0,0 +1,160 @@
+"""Interned vocabulary and sparse speaker-by-term / turn-by-term count matrices."""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+
+class Vocabulary:
+    """Interned terms: every distinct term gets a stable integer id in order of first use."""
+
+    def __init__(self, terms=()):
+        self.term_to_id = {}
+        self.terms = []
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self.term_to_id
+
+    def add(self, term):
+        """Return the id of a term, assigning the next free id to a new term."""
+        term_id = self.term_to_id.get(term)
+        if term_id is None:
+            term_id = self.term_to_id[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def get(self, term, default=None):
+        return self.term_to_id.get(term, default)
+
+    def encode(self, tokens, grow=True):
+        """Map tokens to an int32 array of ids; unknown tokens are skipped when `grow` is False."""
+        if grow:
+            return np.fromiter((self.add(token) for token in tokens), dtype=np.int32)
+        ids = (self.term_to_id.get(token) for token in tokens)
+        return np.fromiter((term_id for term_id in ids if term_id is not None), dtype=np.int32)
+
+    def decode(self, ids):
+        return [self.terms[term_id] for term_id in ids]
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.terms, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+
+class CountMatrix:
+    """A sparse CSR count matrix with one labelled row per speaker (or turn) and one column per vocabulary term."""
+
+    def __init__(self, matrix, labels, vocabulary):
+        self.matrix = sparse.csr_matrix(matrix)
+        self.labels = list(labels)
+        self.vocabulary = vocabulary
+        self.index = {label: row for row, label in enumerate(self.labels)}
+
+    @property
+    def shape(self):
+        return self.matrix.shape
+
+    def resized(self):
+        """Return the matrix widened to the current vocabulary size (the vocabulary may have grown since it was built)."""
+        matrix = self.matrix.copy()
+        matrix.resize((matrix.shape[0], len(self.vocabulary)))
+        return CountMatrix(matrix, self.labels, self.vocabulary)
+
+    def totals(self):
+        """Total number of tokens in each row."""
+        return np.asarray(self.matrix.sum(axis=1)).ravel()
+
+    def normalized(self):
+        """Return the matrix with each row scaled to relative frequencies (rows sum to 1)."""
+        totals = self.totals().astype(np.float64)
+        totals[totals == 0] = 1.0
+        return sparse.diags(1.0 / totals) @ self.matrix
+
+    def row_counts(self, label):
+        """Return a label's counts as a {term: count} dict."""
+        row = self.matrix.getrow(self.index[label])
+        return {self.vocabulary.terms[term_id]: int(count) for term_id, count in zip(row.indices, row.data)}
+
+    def top_k(self, label, k=5):
+        """Return the k most frequent (term, count) pairs of a row, highest first."""
+        row = self.matrix.getrow(self.index[label])
+        if row.nnz == 0:
+            return []
+        top = np.lexsort((row.indices, -row.data))[:k]  # Sort by count, then by term id for stable ties
+        return [(self.vocabulary.terms[row.indices[i]], int(row.data[i])) for i in top]
+
+
+def _coo_from_rows(token_rows, vocabulary, grow=True):
+    """Build a COO count matrix from an iterable of token lists, one row per list."""
+    row_ids, col_ids = [], []
+    n_rows = 0
+    for row, tokens in enumerate(token_rows):
+        ids = vocabulary.encode(tokens, grow=grow)
+        col_ids.append(ids)
+        row_ids.append(np.full(len(ids), row, dtype=np.int32))
+        n_rows = row + 1
+
+    cols = np.concatenate(col_ids) if col_ids else np.empty(0, dtype=np.int32)
+    rows = np.concatenate(row_ids) if row_ids else np.empty(0, dtype=np.int32)
+    data = np.ones(len(cols), dtype=np.int32)
+    return sparse.coo_matrix((data, (rows, cols)), shape=(n_rows, len(vocabulary)))  # Duplicate entries are summed
+
+
+def build_count_matrices(speaker_segments, vocabulary=None):
+    """Build turn-by-term and speaker-by-term count matrices from `segregate_statements_and_export` output.
+
+    Turn rows are labelled (speaker, turn index within that speaker). The speaker matrix is
+    aggregated from the turn matrix with a sparse speaker-by-turn indicator product.
+    """
+    if vocabulary is None:
+        vocabulary = Vocabulary()
+
+    speakers = list(speaker_segments)
+    turn_labels = [(speaker, i) for speaker in speakers for i in range(len(speaker_segments[speaker]))]
+    turn_matrix = _coo_from_rows((statement.split() for speaker in speakers for statement in speaker_segments[speaker]),
+                                 vocabulary).tocsr()
+
+    speaker_index = {speaker: row for row, speaker in enumerate(speakers)}
+    speaker_rows = np.array([speaker_index[speaker] for speaker, _ in turn_labels], dtype=np.int32)
+    indicator = sparse.csr_matrix((np.ones(len(turn_labels), dtype=np.int32), (speaker_rows, np.arange(len(turn_labels)))),
+                                  shape=(len(speakers), len(turn_labels)))
+    speaker_matrix = indicator @ turn_matrix
+
+    return CountMatrix(speaker_matrix, speakers, vocabulary), CountMatrix(turn_matrix, turn_labels, vocabulary)
+
+
+def count_matrix_from_counters(word_counts, vocabulary=None):
+    """Build a count matrix from a {label: {term: count}} mapping, e.g. the counters of a `FrequencyStore`."""
+    if vocabulary is None:
+        vocabulary = Vocabulary()
+
+    labels = list(word_counts)
+    rows, cols, data = [], [], []
+    for row, label in enumerate(labels):
+        counts = word_counts[label]
+        cols.extend(vocabulary.add(term) for term in counts)
+        data.extend(counts.values())
+        rows.extend([row] * len(counts))
+
+    matrix = sparse.csr_matrix((np.array(data, dtype=np.int32), (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+                               shape=(len(labels), len(vocabulary)))
+    return CountMatrix(matrix, labels, vocabulary)
+
+
+def stack_count_matrices(count_matrices):
+    """Stack count matrices sharing one vocabulary (e.g. one per debate) into a single matrix."""
+    count_matrices = [count_matrix.resized() for count_matrix in count_matrices]
+    labels = [label for count_matrix in count_matrices for label in count_matrix.labels]
+    matrix = sparse.vstack([count_matrix.matrix for count_matrix in count_matrices], format='csr')
+    return CountMatrix(matrix, labels, count_matrices[0].vocabulary)
@@ -0,0 +1,147 @@
+"""N-gram (phrase) frequencies and collocation scores with bounded memory.
+
+Every n-gram is counted approximately in a count-min sketch of fixed size, and only the
+`capacity` most frequent candidates are kept as exact keys, so memory does not grow with the
+number of distinct phrases in a corpus. Unigram counts (the vocabulary) are kept exactly for
+collocation scoring.
+"""
+
+import hashlib
+import math
+from collections import Counter
+
+import numpy as np
+
+
+def iter_ngrams(tokens, n):
+    """Yield the n-grams of one turn as tuples; n-grams never span two turns."""
+    return zip(*(tokens[i:] for i in range(n)))
+
+
+class CountMinSketch:
+    """Approximate counts in a depth x width table; estimates never undercount and sketches of equal shape can be merged."""
+
+    def __init__(self, width=1 << 17, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+
+    def _columns(self, items):
+        """Column of each item in every row, by double hashing one BLAKE2b digest per item."""
+        digests = np.frombuffer(b''.join(hashlib.blake2b('\x1f'.join(item).encode('utf-8'), digest_size=16).digest()
+                                         for item in items), dtype=np.uint64).reshape(-1, 2)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((digests[:, 0] + rows * (digests[:, 1] | np.uint64(1))) % np.uint64(self.width)).astype(np.int64)
+
+    def add(self, items):
+        """Count a batch of items (tuples of strings)."""
+        if not items:
+            return
+        columns = self._columns(items)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], 1)
+
+    def estimate(self, items):
+        """Return the estimated count of each item as an array."""
+        if not items:
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(items)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def merge(self, other):
+        if self.table.shape != other.table.shape:
+            raise ValueError("Only sketches with the same width and depth can be merged")
+        self.table += other.table
+        return self
+
+
+class NgramCounter:
+    """Bounded-memory n-gram counts for one speaker (or any group of turns)."""
+
+    def __init__(self, n=2, capacity=10000, sketch_width=1 << 17, sketch_depth=4):
+        if n < 2:
+            raise ValueError("Use word_frequency_analysis for unigrams; n must be at least 2")
+        self.n = n
+        self.capacity = capacity
+        self.sketch = CountMinSketch(sketch_width, sketch_depth)
+        self.candidates = {}  # N-gram -> estimated count, for the most frequent n-grams only
+        self.unigrams = Counter()
+        self.total_ngrams = 0
+
+    def update(self, tokens):
+        """Count the n-grams of one turn's tokens."""
+        tokens = list(tokens)
+        self.unigrams.update(tokens)
+        ngrams = list(iter_ngrams(tokens, self.n))
+        if not ngrams:
+            return
+        self.total_ngrams += len(ngrams)
+        self.sketch.add(ngrams)
+
+        unique = list(dict.fromkeys(ngrams))
+        self.candidates.update(zip(unique, self.sketch.estimate(unique).tolist()))
+        if len(self.candidates) > 2 * self.capacity:
+            self._prune()
+
+    def update_statements(self, statements):
+        """Count the n-grams of cleaned, space-separated statements, one turn each."""
+        for statement in statements:
+            self.update(statement.split())
+
+    def _prune(self):
+        keep = sorted(self.candidates.items(), key=lambda item: -item[1])[:self.capacity]
+        self.candidates = dict(keep)
+
+    def merge(self, other):
+        """Add another counter's sketch, unigrams and candidates (e.g. from another worker or debate)."""
+        if other.n != self.n:
+            raise ValueError("Only counters of the same n can be merged")
+        self.sketch.merge(other.sketch)
+        self.unigrams.update(other.unigrams)
+        self.total_ngrams += other.total_ngrams
+        ngrams = list(set(self.candidates) | set(other.candidates))
+        self.candidates = dict(zip(ngrams, self.sketch.estimate(ngrams).tolist()))
+        if len(self.candidates) > self.capacity:
+            self._prune()
+        return self
+
+    def estimate(self, ngram):
+        return int(self.sketch.estimate([tuple(ngram)])[0])
+
+    def most_common(self, k=None):
+        """Return the k most frequent (n-gram, estimated count) pairs."""
+        ranked = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:k] if k is not None else ranked
+
+    def collocations(self, k=10, measure='pmi', min_count=3):
+        """Rank candidate phrases by how much more often their words occur together than by chance.
+
+        `measure` is 'pmi' (pointwise mutual information) or 't' (t-score, which favours frequent
+        phrases). Phrases seen fewer than `min_count` times are skipped, as PMI overrates rare ones.
+        """
+        total_words = sum(self.unigrams.values())
+        if not total_words or not self.total_ngrams:
+            return []
+
+        scored = []
+        for ngram, count in self.candidates.items():
+            if count < min_count:
+                continue
+            expected = self.total_ngrams * math.prod(self.unigrams[word] / total_words for word in ngram)
+            if measure == 'pmi':
+                score = math.log2(count / expected)
+            elif measure == 't':
+                score = (count - expected) / math.sqrt(count)
+            else:
+                raise ValueError(f"Unknown collocation measure '{measure}', expected 'pmi' or 't'")
+            scored.append((ngram, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:k]
+
+
+def ngram_frequency_analysis(speaker_statements, n=2, capacity=10000):
+    """Perform n-gram (phrase) frequency analysis on the cleaned statements of a speaker."""
+    counter = NgramCounter(n=n, capacity=capacity)
+    counter.update_statements(speaker_statements)
+    return counter
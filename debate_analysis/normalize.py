@@ -0,0 +1,70 @@
+"""Normalization of cleaned tokens: case folding plus lemmatization or stemming, memoized by surface form."""
+
+import functools
+
+from debate_analysis.resources import ensure_nltk_resources
+
+NORMALIZERS = ('lemma', 'stem')  # WordNet lemmatization or Snowball stemming
+
+
+def _lemmatizer():
+    ensure_nltk_resources(['wordnet'])
+    from nltk.stem import WordNetLemmatizer  # Imported lazily: importing NLTK takes over a second
+
+    lemmatize = WordNetLemmatizer().lemmatize
+
+    def lemma(word):
+        verb = lemmatize(word, 'v')  # 'said' -> 'say', 'coming' -> 'come'
+        return verb if verb != word else lemmatize(word, 'n')  # 'taxes' -> 'tax'
+
+    return lemma
+
+
+def _stemmer():
+    from nltk.stem.snowball import SnowballStemmer  # Needs no NLTK data
+
+    return SnowballStemmer('english').stem
+
+
+class Normalizer:
+    """Map cleaned tokens to a normal form, so inflected forms ('tax'/'taxes', 'say'/'said') are counted together.
+
+    Tokens are case-folded, then lemmatized with WordNet (as a verb, falling back to a noun) or stemmed
+    with the Snowball stemmer. The normal form of each surface form is memoized in an LRU cache of at
+    most `cache_size` entries; debate vocabulary is small and repetitive, so nearly every token is a cache hit.
+    With a stopword filter, tokens whose normal form is a stopword ('wants' -> 'want') are dropped too.
+    """
+
+    def __init__(self, method='lemma', cache_size=8192, stopword_filter=None):
+        if method not in NORMALIZERS:
+            raise ValueError(f"unknown normalizer {method!r}; expected one of {', '.join(NORMALIZERS)}")
+        self.method = method
+        self.cache_size = cache_size
+        normal_form = _lemmatizer() if method == 'lemma' else _stemmer()
+        stopwords = stopword_filter.words if stopword_filter is not None else frozenset()
+
+        @functools.lru_cache(maxsize=cache_size)
+        def normalize(token):
+            word = normal_form(token.casefold())
+            return '' if word in stopwords else word  # An empty form marks a token to drop
+
+        self._normalize = normalize
+
+    def normalize_token(self, token):
+        """Return the normal form of a token, or '' when it is a stopword once normalized."""
+        return self._normalize(token)
+
+    def normalize_tokens(self, tokens):
+        return [word for word in map(self._normalize, tokens) if word]
+
+    def normalize_statement(self, statement):
+        """Normalize a cleaned (space-separated) statement."""
+        return ' '.join(self.normalize_tokens(statement.split()))
+
+    def normalize_turns(self, turns):
+        """Normalize the statements of (speaker, cleaned statement) turns."""
+        return [(speaker, self.normalize_statement(statement)) for speaker, statement in turns]
+
+    def cache_info(self):
+        """Hits, misses and size of the memo cache, as reported by `functools.lru_cache`."""
+        return self._normalize.cache_info()
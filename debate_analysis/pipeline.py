@@ -0,0 +1,99 @@
+"""Segmentation and cleaning of whole transcripts, with optional caching and parallel cleaning."""
+
+from debate_analysis.cache import make_key
+from debate_analysis.cleaning import clean_statements, clean_turns, cleaning_pool, default_stopword_filter, tokenizer_version
+from debate_analysis.ingest import debate_id_for, file_fingerprint, find_transcript_files, read_transcript_lines, segment_turns
+from debate_analysis.profiling import NULL_INSTRUMENTATION
+
+
+TEXT_DEBATE_ID = 'transcript'  # Debate id of a transcript given as raw text rather than as a file
+GROUP_TURNS = 4096  # Uncached turns segmented before a parallel cleaning run, bounding memory on large archives
+
+
+def transcript_documents(transcript, fingerprint=False):
+    """Return (debate id, lines, content key) triples for raw transcript text or a list of transcript files/directories.
+
+    Content keys (a hash of the text) are only computed when `fingerprint` is set, since they cost an extra read.
+    """
+    if isinstance(transcript, str):
+        # Split the transcript into lines
+        return [(TEXT_DEBATE_ID, transcript.splitlines(), make_key(transcript) if fingerprint else None)]
+    return ((debate_id_for(path), read_transcript_lines(path), file_fingerprint(path) if fingerprint else None)
+            for path in find_transcript_files(transcript))
+
+
+def _clean_group(group, executor, stopword_filter, tokenizer, cache, instrumentation):
+    """Clean the segmented turns of a group of (debate id, cache key, turns, cached turns) documents in one pool run."""
+    statements = [statement for _, _, turns, _ in group if turns is not None for _, statement in turns]
+    with instrumentation.stage('clean', items=len(statements)):
+        cleaned_statements = iter(clean_statements(statements, stopword_filter, tokenizer=tokenizer, executor=executor))
+    results = []
+    for debate_id, key, turns, cleaned_turns in group:
+        if turns is not None:
+            cleaned_turns = [(speaker, next(cleaned_statements)) for speaker, _ in turns]
+            if cache is not None:
+                cache.put_json(key, cleaned_turns)
+        results.append((debate_id, cleaned_turns))
+    return results
+
+
+def clean_documents(documents, matcher, stopword_filter=None, workers=1, cache=None, instrumentation=None, tokenizer='nltk',
+                    group_turns=GROUP_TURNS):
+    """Yield (debate id, cleaned (speaker, statement) turns) for each document, in document order.
+
+    Documents are (debate id, lines, content key) triples from `transcript_documents`. With a cache, a document's
+    cleaned turns are stored under its content key, the stopword set, the tokenizer version and
+    the speaker configuration, so unchanged transcripts are not segmented or tokenized again.
+    With more than one worker, one process pool cleans the uncached documents in groups of consecutive
+    documents holding at least `group_turns` turns (or the last ones), so only a group is held in memory at a time.
+    Segmentation and cleaning are timed as the 'segment' and 'clean' stages
+    of `instrumentation`; when it is enabled, each document's turns are segmented before cleaning
+    instead of being streamed, so the two stages can be told apart. `tokenizer` selects the tokenizer
+    backend ('nltk' or 'regex', see `debate_analysis.cleaning.tokenize_batch`).
+    """
+    if stopword_filter is None:
+        stopword_filter = default_stopword_filter()
+    if instrumentation is None:
+        instrumentation = NULL_INSTRUMENTATION
+
+    def cache_key(content_key):
+        return make_key(content_key, stopword_filter.fingerprint(), tokenizer_version(tokenizer), matcher.config_key())
+
+    if workers == 1:
+        for debate_id, lines, content_key in documents:
+            cleaned_turns = cache.get_json(cache_key(content_key)) if cache is not None else None
+            if cleaned_turns is None:
+                turns = segment_turns(lines, matcher)
+                if instrumentation.enabled:
+                    with instrumentation.stage('segment') as event:
+                        turns = list(turns)
+                        event.items = len(turns)
+                with instrumentation.stage('clean') as event:
+                    cleaned_turns = clean_turns(turns, stopword_filter, tokenizer)
+                    event.items = len(cleaned_turns)
+                if cache is not None:
+                    cache.put_json(cache_key(content_key), cleaned_turns)
+            yield debate_id, cleaned_turns
+        return
+
+    # The pool is kept for the whole archive; its worker processes only start once a group needs them
+    executor = cleaning_pool(stopword_filter, workers, tokenizer)
+    try:
+        group, group_size = [], 0  # (debate id, cache key, segmented turns or None, cached turns or None)
+        for debate_id, lines, content_key in documents:
+            key = cache_key(content_key) if cache is not None else None
+            cleaned_turns = cache.get_json(key) if cache is not None else None
+            turns = None
+            if cleaned_turns is None:
+                with instrumentation.stage('segment') as event:
+                    turns = list(segment_turns(lines, matcher))
+                    event.items = len(turns)
+                group_size += len(turns)
+            group.append((debate_id, key, turns, cleaned_turns))
+            if group_size >= group_turns:
+                yield from _clean_group(group, executor, stopword_filter, tokenizer, cache, instrumentation)
+                group, group_size = [], 0
+        if group:
+            yield from _clean_group(group, executor, stopword_filter, tokenizer, cache, instrumentation)
+    finally:
+        executor.shutdown()
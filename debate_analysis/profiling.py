@@ -0,0 +1,146 @@
+"""Per-stage timing, item counts and memory instrumentation with pluggable hooks."""
+
+import contextlib
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+
+STAGES = ('segment', 'clean', 'normalize', 'count', 'export', 'index', 'render')
+
+
+def _peak_rss_bytes():
+    """The process's peak RSS, or None where it is not available (the `resource` module is Unix-only)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports kilobytes
+
+
+class StageEvent:
+    """One execution of a stage; the code inside the stage sets `items` to the number of units it processed."""
+
+    def __init__(self, name, items=0):
+        self.name = name
+        self.items = items
+        self.seconds = 0.0
+        self.memory_delta = 0  # Bytes: traced allocation growth, or peak RSS growth when memory tracing is off (0 if unavailable)
+
+    def to_dict(self):
+        return {'name': self.name, 'items': self.items, 'seconds': self.seconds, 'memory_delta': self.memory_delta}
+
+
+class Instrumentation:
+    """Collect timings, item counts and memory deltas for every stage run inside `stage()`.
+
+    Hooks are called with each finished `StageEvent`, e.g. to log progress or forward metrics.
+    With `trace_memory`, memory deltas come from tracemalloc (accurate but slower); otherwise from
+    the growth of the process's peak RSS, which is not available on Windows (deltas are then 0). With `profile`, a cProfile profiler runs between
+    `start()` and `stop()` and can be dumped for pstats/snakeviz.
+    """
+
+    enabled = True
+
+    def __init__(self, hooks=(), trace_memory=False, profile=False):
+        self.hooks = list(hooks)
+        self.trace_memory = trace_memory
+        self.profiler = cProfile.Profile() if profile else None
+        self.stats = {}  # Stage name -> aggregated totals
+        self.started_at = None
+        self.wall_seconds = 0.0
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def start(self):
+        """Begin a run: starts memory tracing and the profiler when enabled."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profiler is not None:
+            self.profiler.enable()
+        self.started_at = time.perf_counter()
+
+    def stop(self):
+        if self.started_at is not None:
+            self.wall_seconds += time.perf_counter() - self.started_at
+            self.started_at = None
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _memory(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return _peak_rss_bytes() or 0
+
+    @contextlib.contextmanager
+    def stage(self, name, items=0):
+        """Time the enclosed block as one execution of a stage and yield its `StageEvent`."""
+        event = StageEvent(name, items)
+        memory_before = self._memory()
+        start = time.perf_counter()
+        try:
+            yield event
+        finally:
+            event.seconds = time.perf_counter() - start
+            event.memory_delta = self._memory() - memory_before
+            self._record(event)
+
+    def _record(self, event):
+        stats = self.stats.setdefault(event.name, {'calls': 0, 'seconds': 0.0, 'items': 0, 'memory_delta': 0, 'max_memory_delta': 0})
+        stats['calls'] += 1
+        stats['seconds'] += event.seconds
+        stats['items'] += event.items
+        stats['memory_delta'] += event.memory_delta
+        stats['max_memory_delta'] = max(stats['max_memory_delta'], event.memory_delta)
+        for hook in self.hooks:
+            hook(event)
+
+    def report(self):
+        """Return the aggregated per-stage totals, with throughput, as a JSON-serializable dict."""
+        stages = {}
+        for name, stats in self.stats.items():
+            stages[name] = dict(stats, items_per_second=stats['items'] / stats['seconds'] if stats['seconds'] else None)
+        if self.trace_memory:
+            memory_source = 'tracemalloc'
+        else:
+            memory_source = 'peak_rss' if _peak_rss_bytes() is not None else None  # No RSS without `resource`; use tracemalloc
+        return {'wall_seconds': self.wall_seconds, 'memory_source': memory_source, 'stages': stages}
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def dump_profile(self, path):
+        """Write the cProfile statistics collected between `start()` and `stop()`."""
+        if self.profiler is None:
+            raise ValueError("Profiling was not enabled for this instrumentation")
+        self.profiler.dump_stats(path)
+
+
+class NullInstrumentation:
+    """Instrumentation that records nothing; the default, so uninstrumented runs pay almost no cost."""
+
+    enabled = False
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    @contextlib.contextmanager
+    def stage(self, name, items=0):
+        yield StageEvent(name, items)
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def print_hook(event):
+    """A hook that prints each finished stage, e.g. `Instrumentation(hooks=[print_hook])`."""
+    print(f"[{event.name}] {event.items} items in {event.seconds:.3f} s ({event.memory_delta / 2 ** 20:+.1f} MB)")
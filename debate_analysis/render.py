@@ -0,0 +1,105 @@
+"""Headless rendering of word clouds straight to image files."""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import wordcloud as wordcloud_module
+from matplotlib.figure import Figure  # Figures created directly do not need an interactive backend or pyplot
+from wordcloud import WordCloud
+
+from debate_analysis.cache import make_key
+
+FORMATS = ('png', 'svg')
+LAYOUT_VERSION = 2  # Bumped when the saved image layout changes, e.g. version 2 sizes the image from width x height
+RENDERER_VERSION = (f"wordcloud-{wordcloud_module.__version__}-matplotlib-{matplotlib.__version__}"
+                    f"-layout-{LAYOUT_VERSION}")  # Part of cache keys
+
+
+def word_cloud_path(output_dir, label, fmt='png'):
+    """Return the image path for a speaker label or a (debate_id, speaker) label, e.g. 'WordClouds/Biden_WC.png'."""
+    if isinstance(label, tuple):
+        debate_id, speaker = label
+        name = f"{debate_id}_{speaker.title()}_WC.{fmt}"
+    else:
+        name = f"{label.title()}_WC.{fmt}"
+    return os.path.join(output_dir, name)
+
+
+def render_word_cloud(weights, speaker, output_path, width=1000, height=800, background_color='Black',
+                      figsize=None, dpi=100, max_words=200):
+    """Generate a word cloud for a speaker and save it to `output_path` (PNG or SVG, from the extension).
+
+    The saved image is `width` x `height` pixels unless a `figsize` in inches is given.
+    Layout time grows with `max_words`, so fewer words render faster (e.g. in live mode).
+    """
+    wordcloud = WordCloud(width=width, height=height, background_color=background_color,
+                          max_words=max_words).generate_from_frequencies(weights)
+
+    figure = Figure(figsize=figsize or (width / dpi, height / dpi))
+    ax = figure.add_subplot()
+    ax.imshow(wordcloud, interpolation='bilinear')  # Display the word cloud
+    ax.set_title(f"Word Cloud for {speaker}")  # Set title
+    ax.axis('off')  # Hide axis
+    figure.savefig(output_path, dpi=dpi)
+
+    return output_path
+
+
+def _render_job(job):
+    weights, speaker, output_path, options = job
+    return render_word_cloud(weights, speaker, output_path, **options)
+
+
+def _image_key(weights, speaker, fmt, options):
+    """Cache key of a rendered cloud: its weights, title, format, options and renderer versions."""
+    return make_key(json.dumps(sorted(weights.items()), ensure_ascii=False), speaker, fmt,
+                    repr(sorted(options.items())), RENDERER_VERSION)
+
+
+def render_word_clouds(speaker_weights, output_dir, fmt='png', workers=1, cache=None, **options):
+    """Render one word cloud file per entry of `speaker_weights` and return {label: path}.
+
+    Labels are speakers or (debate_id, speaker) pairs, so clouds of several debates can be
+    rendered in one call. With `workers` greater than 1 (0 = every core) the clouds are
+    rendered concurrently in a process pool. With a `ContentCache`, images of unchanged
+    clouds are copied from the cache instead of being rendered again.
+    Extra options are passed to `render_word_cloud`.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported word cloud format '{fmt}', expected one of {FORMATS}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths, jobs, job_keys = {}, [], []
+    for label, weights in speaker_weights.items():
+        if not weights:
+            continue  # WordCloud cannot lay out an empty cloud
+        speaker = label[1] if isinstance(label, tuple) else label
+        output_path = word_cloud_path(output_dir, label, fmt)
+        paths[label] = output_path
+
+        key = _image_key(weights, speaker, fmt, options) if cache is not None else None
+        image = cache.get(key) if cache is not None else None
+        if image is not None:
+            with open(output_path, 'wb') as f:
+                f.write(image)
+            continue
+
+        jobs.append((dict(weights), speaker, output_path, options))
+        job_keys.append(key)
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        rendered = [_render_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            rendered = list(executor.map(_render_job, jobs))
+
+    if cache is not None:
+        for key, output_path in zip(job_keys, rendered):
+            with open(output_path, 'rb') as f:
+                cache.put(key, f.read())
+
+    return paths
@@ -0,0 +1,75 @@
+"""Offline-safe lookup of the NLTK data used for tokenization and stopwords."""
+
+import os
+import re
+
+# NLTK data bundled with (or pre-fetched into) the project, searched before NLTK's default locations
+BUNDLED_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'nltk_data')
+
+# Each requirement is satisfied by any one of its resource paths
+REQUIRED_RESOURCES = {
+    'tokenizer': ('tokenizers/punkt_tab',),  # word_tokenize of NLTK 3.9+ only loads punkt_tab
+    'stopwords': ('corpora/stopwords',),
+    'wordnet': ('corpora/wordnet',),  # Only needed for lemmatization (--normalize lemma)
+}
+LEGACY_TOKENIZER_RESOURCES = ('tokenizers/punkt',)  # The pickled models loaded by NLTK before 3.9
+
+
+def nltk_version():
+    """The installed NLTK version as a tuple of ints, e.g. (3, 9, 1)."""
+    import nltk
+
+    return tuple(int(part) for part in re.findall(r'\d+', re.match(r'[\d.]*', nltk.__version__).group()))
+
+
+def resource_paths(name):
+    """The resource paths that satisfy a requirement with the installed NLTK."""
+    if name == 'tokenizer' and nltk_version() < (3, 9):
+        return LEGACY_TOKENIZER_RESOURCES
+    return REQUIRED_RESOURCES[name]
+
+
+def add_data_dir(path=BUNDLED_DATA_DIR):
+    """Put a directory of NLTK data at the front of NLTK's search path."""
+    import nltk  # Imported lazily: importing NLTK takes over a second
+
+    if path not in nltk.data.path:
+        nltk.data.path.insert(0, path)
+
+
+def find_resource(paths):
+    """Return the first of the resource paths that is installed, or None."""
+    import nltk
+
+    for path in paths:
+        try:
+            nltk.data.find(path)
+            return path
+        except LookupError:
+            continue
+    return None
+
+
+def ensure_nltk_resources(names=('tokenizer', 'stopwords'), download_dir=None):
+    """Check that NLTK data is available locally, without ever contacting the downloader.
+
+    The bundled `nltk_data/` directory, `$NLTK_DATA` and NLTK's default locations are searched.
+    Only when `download_dir` is given are missing resources fetched into it (the one network access).
+    Raises LookupError listing the missing resources otherwise.
+    """
+    import nltk
+
+    add_data_dir()
+    missing = [name for name in names if find_resource(resource_paths(name)) is None]
+    if missing and download_dir is not None:
+        add_data_dir(download_dir)
+        for name in missing:
+            for path in resource_paths(name):
+                if nltk.download(path.rsplit('/', 1)[1], download_dir=download_dir, quiet=True):
+                    break
+        missing = [name for name in names if find_resource(resource_paths(name)) is None]
+
+    if missing:
+        packages = ' '.join(resource_paths(name)[0].rsplit('/', 1)[1] for name in missing)
+        raise LookupError(f"NLTK data not found for {', '.join(missing)}. Fetch it once with "
+                          f"'python -m nltk.downloader -d {BUNDLED_DATA_DIR} {packages}' or set NLTK_DATA.")
@@ -0,0 +1,78 @@
+"""Distinctive-term scoring (TF-IDF and log-odds) over sparse count matrices."""
+
+import numpy as np
+from scipy import sparse
+
+
+def inverse_document_frequency(doc_matrix):
+    """Smoothed IDF of every term, treating each row of `doc_matrix` (turns, speakers or debates) as a document."""
+    n_docs = doc_matrix.shape[0]
+    doc_freq = np.bincount(sparse.csr_matrix(doc_matrix).indices, minlength=doc_matrix.shape[1])  # Rows containing each term
+    return np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0
+
+
+def tfidf_scores(count_matrix, doc_matrix=None, sublinear_tf=True):
+    """Score each row's terms by TF-IDF.
+
+    `doc_matrix` supplies the document frequencies, e.g. the turn-by-term matrix or a stacked
+    matrix of a whole debate corpus; the rows of `count_matrix` are used when it is omitted.
+    The matrix is widened to the doc matrix's width when the vocabulary grew in between.
+    Returns a sparse matrix with the same shape as the count matrix.
+    """
+    counts = sparse.csr_matrix(count_matrix, dtype=np.float64)
+    if doc_matrix is None:
+        doc_matrix = counts
+    if doc_matrix.shape[1] > counts.shape[1]:
+        counts.resize((counts.shape[0], doc_matrix.shape[1]))
+
+    tf = counts.copy()
+    if sublinear_tf:
+        tf.data = 1.0 + np.log(tf.data)  # Dampen very frequent words
+
+    idf = inverse_document_frequency(doc_matrix)[:counts.shape[1]]
+    return tf @ sparse.diags(idf)
+
+
+def log_odds_scores(count_matrix, prior=0.01):
+    """Score each row's terms by the log-odds ratio against all other rows, with an informative Dirichlet prior.
+
+    The prior is proportional to each term's overall frequency (scaled by `prior` per token), and the
+    result is the z-score of the log-odds difference (Monroe, Colaresi & Quinn, 2008). Positive scores
+    mark terms a speaker uses more than the others. Only the terms a row uses are scored (a term it never
+    uses cannot score positively), so this returns a sparse matrix with the count matrix's nonzero
+    pattern, and memory grows with the number of nonzero counts rather than rows times terms.
+    """
+    counts = sparse.csr_matrix(count_matrix, dtype=np.float64)
+    counts.sum_duplicates()
+    term_totals = np.asarray(counts.sum(axis=0)).ravel()
+    alpha = prior * term_totals + 1e-9  # Avoid zero pseudo-counts for terms that never occur
+    alpha_total = alpha.sum()
+    row_totals = np.asarray(counts.sum(axis=1)).ravel()
+
+    # One value per nonzero count: the row's count of the term and the other rows' count of it
+    row_of = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+    own_counts, term_alpha = counts.data, alpha[counts.indices]
+    rest = term_totals[counts.indices] - own_counts
+    own_totals = row_totals[row_of]
+    rest_totals = row_totals.sum() - own_totals
+
+    own = np.log(own_counts + term_alpha) - np.log(own_totals + alpha_total - own_counts - term_alpha)
+    other = np.log(rest + term_alpha) - np.log(rest_totals + alpha_total - rest - term_alpha)
+    variance = 1.0 / (own_counts + term_alpha) + 1.0 / (rest + term_alpha)
+    return sparse.csr_matrix(((own - other) / np.sqrt(variance), counts.indices.copy(), counts.indptr.copy()),
+                             shape=counts.shape)
+
+
+def term_weights(scores, row, vocabulary, k=200):
+    """Return the k highest positive scores of a row as a {term: weight} dict, e.g. for `plot_word_cloud`."""
+    if sparse.issparse(scores):
+        scores_row = scores.getrow(row)
+        term_ids, values = scores_row.indices, scores_row.data
+    else:
+        values = np.asarray(scores[row])
+        term_ids = np.arange(len(values))
+
+    positive = values > 0
+    term_ids, values = term_ids[positive], values[positive]
+    top = np.lexsort((term_ids, -values))[:k]  # Highest score first, ties by term id
+    return {vocabulary.terms[term_ids[i]]: float(values[i]) for i in top}
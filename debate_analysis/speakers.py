@@ -0,0 +1,74 @@
+"""Single-pass speaker tag matching with alias resolution."""
+
+import re
+from collections import Counter
+
+# A speaker tag at the start of a line: an upper-case name of up to four words, optionally
+# followed by an upper-case role, e.g. "TRUMP:" or "JAKE TAPPER, CNN MODERATOR:"
+TAG_PATTERN = re.compile(r"^(?P<tag>[A-Z][A-Z.'’\-]*(?: [A-Z][A-Z.'’\-]*){0,3}(?:, [A-Z0-9][A-Z0-9.'’\-, ]*)?):(?:\s|$)")
+
+
+def default_canonical_name(tag):
+    """Map a speaker tag to its canonical speaker: the surname before any role, e.g. 'JAKE TAPPER, CNN MODERATOR' -> 'TAPPER'."""
+    name = tag.split(',', 1)[0].strip()
+    return name.split()[-1]
+
+
+class SpeakerMatcher:
+    """Classify transcript lines by speaker with one anchored regex match per line.
+
+    Tags are discovered as they appear in the transcript and resolved once to a canonical
+    speaker, using `aliases` (tag or name -> speaker) before falling back to the surname.
+    When `speakers` is given, tags resolving to any other speaker are treated as ordinary text.
+    """
+
+    def __init__(self, speakers=None, aliases=None):
+        self.speakers = frozenset(speakers) if speakers is not None else None
+        self.aliases = dict(aliases or {})
+        self.tags = {}  # Every tag seen so far -> canonical speaker (or None when rejected)
+
+    def config_key(self):
+        """Return a string describing the matcher's configuration, used to key cached segmentation results."""
+        speakers = sorted(self.speakers) if self.speakers is not None else None
+        return repr((speakers, sorted(self.aliases.items())))
+
+    def canonical(self, tag):
+        """Return the canonical speaker for a tag, or None when the tag is not an accepted speaker."""
+        try:
+            return self.tags[tag]
+        except KeyError:
+            pass
+
+        name = tag.split(',', 1)[0].strip()
+        speaker = self.aliases.get(tag) or self.aliases.get(name) or default_canonical_name(tag)
+        if self.speakers is not None and speaker not in self.speakers:
+            speaker = None
+
+        self.tags[tag] = speaker
+        return speaker
+
+    def match(self, line):
+        """Return (speaker, rest of line) when the line opens a new turn, otherwise None."""
+        m = TAG_PATTERN.match(line)
+        if m is None:
+            return None
+
+        speaker = self.canonical(m.group('tag'))
+        if speaker is None:
+            return None
+
+        return speaker, line[m.end():].strip()
+
+    def discovered_speakers(self):
+        """Return the accepted speakers in the order they were first seen."""
+        return list(dict.fromkeys(speaker for speaker in self.tags.values() if speaker))
+
+
+def discover_speaker_tags(lines):
+    """Count every speaker tag in an iterable of lines, e.g. to review aliases before a run."""
+    tags = Counter()
+    for line in lines:
+        m = TAG_PATTERN.match(line)
+        if m:
+            tags[m.group('tag')] += 1
+    return tags
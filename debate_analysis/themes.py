@@ -0,0 +1,143 @@
+"""Topic-level thematic analysis: keyword-seeded themes and minibatch NMF topics over turn-by-term matrices."""
+
+import numpy as np
+from scipy import sparse
+
+# Seed keywords of the debate's main themes, matched case-insensitively against cleaned tokens
+SEED_THEMES = {
+    'economy': ['economy', 'inflation', 'prices', 'jobs', 'tax', 'taxes', 'wealthy', 'billionaires', 'deficit', 'debt',
+                'tariff', 'tariffs', 'wages', 'money', 'billion', 'trillion', 'housing', 'childcare', 'insulin', 'pharma'],
+    'immigration': ['border', 'immigration', 'immigrants', 'migrants', 'illegal', 'patrol', 'asylum', 'prisons',
+                    'mental', 'institutions', 'crossing', 'deport', 'millions'],
+    'foreign policy': ['Ukraine', 'Russia', 'Putin', 'Israel', 'Hamas', 'Gaza', 'China', 'NATO', 'Afghanistan', 'war',
+                       'wars', 'military', 'troops', 'Iran', 'Xi', 'Kim', 'allies', 'soldiers'],
+    'abortion': ['abortion', 'Roe', 'Wade', 'women', 'woman', 'pregnant', 'pill', 'states', 'decision', 'court'],
+    'democracy': ['January', 'Capitol', 'election', 'democracy', 'convicted', 'felon', 'indictment', 'indicted',
+                  'violence', 'fraud', 'results', 'accept', 'police'],
+    'climate': ['climate', 'environment', 'water', 'clean', 'Paris', 'accord', 'pollution', 'energy', 'oil'],
+    'health care': ['Medicare', 'Social', 'Security', 'health', 'care', 'insurance', 'drug', 'drugs', 'opioid',
+                    'fentanyl', 'veterans', 'seniors'],
+}
+
+
+def theme_term_matrix(themes, vocabulary):
+    """Sparse themes-by-terms indicator of which vocabulary terms seed each theme."""
+    seed_themes = {}
+    for theme_row, keywords in enumerate(themes.values()):
+        for keyword in keywords:
+            seed_themes.setdefault(keyword.casefold(), []).append(theme_row)
+
+    rows, cols = [], []
+    for term_id, term in enumerate(vocabulary.terms):
+        for theme_row in seed_themes.get(term.casefold(), ()):
+            rows.append(theme_row)
+            cols.append(term_id)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(themes), len(vocabulary)))
+
+
+def seeded_themes(turn_matrix, themes=SEED_THEMES):
+    """Score every turn against keyword-seeded themes.
+
+    Returns a dense turns-by-themes array of seed keyword counts; `assign_themes` turns it into labels.
+    """
+    indicator = theme_term_matrix(themes, turn_matrix.vocabulary)
+    return np.asarray((turn_matrix.resized().matrix @ indicator.T).todense())
+
+
+def assign_themes(turn_theme_scores, theme_names, other='other'):
+    """Label each turn with its highest-scoring theme, or `other` when no theme scores above zero."""
+    best = np.argmax(turn_theme_scores, axis=1)
+    has_theme = turn_theme_scores.max(axis=1) > 0
+    return [theme_names[b] if ok else other for b, ok in zip(best, has_theme)]
+
+
+def speaker_theme_share(turn_theme_weights, turn_labels, theme_names):
+    """Aggregate turn-by-theme weights into each speaker's share of every theme (rows sum to 1).
+
+    Turn labels are the (speaker, turn index) labels of `build_count_matrices`. Returns {speaker: {theme: share}}.
+    """
+    speakers = list(dict.fromkeys(speaker for speaker, _ in turn_labels))
+    speaker_rows = {speaker: row for row, speaker in enumerate(speakers)}
+    indicator = sparse.csr_matrix((np.ones(len(turn_labels)), ([speaker_rows[speaker] for speaker, _ in turn_labels],
+                                                               np.arange(len(turn_labels)))),
+                                  shape=(len(speakers), len(turn_labels)))
+    totals = np.asarray(indicator @ turn_theme_weights)
+    sums = totals.sum(axis=1, keepdims=True)
+    shares = np.divide(totals, sums, out=np.zeros_like(totals, dtype=np.float64), where=sums > 0)
+    return {speaker: dict(zip(theme_names, shares[row].tolist())) for speaker, row in speaker_rows.items()}
+
+
+class MiniBatchNMF:
+    """Non-negative matrix factorization X ~ W @ H fitted on minibatches of rows of a sparse matrix.
+
+    H (topics by terms) is updated from running statistics A = W^T X and B = W^T W that are decayed by
+    `forget` each batch, so only one batch of rows is densified at a time. Uses multiplicative updates.
+    """
+
+    def __init__(self, n_topics=8, batch_size=256, n_epochs=10, inner_iter=30, forget=0.9, seed=0):
+        self.n_topics = n_topics
+        self.batch_size = batch_size
+        self.n_epochs = n_epochs
+        self.inner_iter = inner_iter
+        self.forget = forget
+        self.rng = np.random.default_rng(seed)
+        self.components = None  # H
+        self._A = self._B = None
+
+    def _init(self, X):
+        scale = np.sqrt(max(X.mean(), 1e-12) / self.n_topics)
+        self.components = self.rng.uniform(0.5, 1.5, (self.n_topics, X.shape[1])) * scale
+        self._A = np.zeros((self.n_topics, X.shape[1]))
+        self._B = np.zeros((self.n_topics, self.n_topics))
+
+    def _solve_w(self, X):
+        H = self.components
+        W = np.full((X.shape[0], self.n_topics), 1.0 / self.n_topics)
+        XHt = np.asarray(X @ H.T)
+        HHt = H @ H.T
+        for _ in range(self.inner_iter):
+            W *= XHt / (W @ HHt + 1e-10)
+        return W
+
+    def partial_fit(self, X):
+        X = sparse.csr_matrix(X, dtype=np.float64)
+        if self.components is None:
+            self._init(X)
+        W = self._solve_w(X)
+        self._A = self.forget * self._A + np.asarray((X.T @ W).T)
+        self._B = self.forget * self._B + W.T @ W
+        for _ in range(self.inner_iter):
+            self.components *= self._A / (self._B @ self.components + 1e-10)
+        return self
+
+    def fit(self, X):
+        X = sparse.csr_matrix(X, dtype=np.float64)
+        for _ in range(self.n_epochs):
+            order = self.rng.permutation(X.shape[0])
+            for start in range(0, X.shape[0], self.batch_size):
+                self.partial_fit(X[order[start:start + self.batch_size]])
+        return self
+
+    def transform(self, X):
+        """Topic weights (W) of each row, computed a batch at a time."""
+        X = sparse.csr_matrix(X, dtype=np.float64)
+        return np.vstack([self._solve_w(X[start:start + self.batch_size]) for start in range(0, X.shape[0], self.batch_size)])
+
+    def topic_terms(self, vocabulary, k=5):
+        """Return the k heaviest terms of each topic."""
+        return [[vocabulary.terms[term_id] for term_id in np.argsort(-topic)[:k]] for topic in self.components]
+
+
+def nmf_topics(turn_matrix, n_topics=8, **options):
+    """Fit minibatch NMF topics on TF-IDF-weighted turns; returns (model, turns-by-topics weights, topic names)."""
+    from debate_analysis.scoring import tfidf_scores
+
+    weighted = tfidf_scores(turn_matrix.matrix)
+    rows = sparse.csr_matrix(weighted)
+    norms = np.sqrt(np.asarray(rows.multiply(rows).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    rows = sparse.diags(1.0 / norms) @ rows  # Unit-length rows, so long turns do not dominate the topics
+
+    model = MiniBatchNMF(n_topics=n_topics, **options).fit(rows)
+    names = [' / '.join(terms) for terms in model.topic_terms(turn_matrix.vocabulary, k=3)]
+    return model, model.transform(rows), names
@@ -0,0 +1,73 @@
+"""Turn-level timeline: sliding-window term frequencies and speaking share, updated incrementally."""
+
+import csv
+from collections import Counter, deque
+
+
+class SlidingWindowTimeline:
+    """Slide a window of `window` turns through each debate in turn order, emitting one row every `step` turns.
+
+    Window counts are updated by adding the turn that enters and subtracting the turn that leaves,
+    rather than recounting every window. Windows never span two debates. Each row records, per
+    speaker, the tokens spoken in the window, the speaker's share of them, the top terms and the
+    counts of any `tracked_terms` (case-insensitive), ready for time-series plots.
+    """
+
+    def __init__(self, window=10, step=1, top_k=5, tracked_terms=()):
+        if window < 1 or step < 1:
+            raise ValueError("window and step must be at least 1")
+        self.window = window
+        self.step = step
+        self.top_k = top_k
+        self.tracked_terms = [term.casefold() for term in tracked_terms]
+        self.rows = []
+
+    def add_document(self, debate_id, cleaned_turns):
+        """Slide the window over the cleaned (speaker, statement) turns of one debate."""
+        in_window = deque()  # (speaker, token Counter) of the turns currently in the window
+        speaker_terms = {}  # Speaker -> Counter of terms in the window
+        speaker_tokens = Counter()
+        n_turns = 0
+
+        for turn_index, (speaker, statement) in enumerate(cleaned_turns):
+            terms = Counter(token.casefold() for token in statement.split())
+            in_window.append((speaker, terms))
+            speaker_terms.setdefault(speaker, Counter()).update(terms)
+            speaker_tokens[speaker] += sum(terms.values())
+            n_turns = turn_index + 1
+
+            if len(in_window) > self.window:  # Remove the turn that left the window
+                old_speaker, old_terms = in_window.popleft()
+                window_terms = speaker_terms[old_speaker]
+                for term, count in old_terms.items():
+                    window_terms[term] -= count
+                    if not window_terms[term]:
+                        del window_terms[term]
+                speaker_tokens[old_speaker] -= sum(old_terms.values())
+
+            if len(in_window) == self.window and (n_turns - self.window) % self.step == 0:
+                self._emit(debate_id, n_turns - self.window, n_turns, speaker_terms, speaker_tokens)
+
+        if 0 < n_turns < self.window:  # A debate shorter than the window still gets one row
+            self._emit(debate_id, 0, n_turns, speaker_terms, speaker_tokens)
+
+    def _emit(self, debate_id, start, end, speaker_terms, speaker_tokens):
+        total = sum(speaker_tokens.values())
+        for speaker, terms in speaker_terms.items():
+            self.rows.append({
+                'debate_id': debate_id, 'window_start': start, 'window_end': end, 'speaker': speaker,
+                'tokens': speaker_tokens[speaker], 'speaking_share': speaker_tokens[speaker] / total if total else 0.0,
+                'top_terms': terms.most_common(self.top_k),
+                'tracked': {term: terms.get(term, 0) for term in self.tracked_terms},
+            })
+
+    def write_csv(self, path):
+        """Write one row per window and speaker; top terms as 'term:count' pairs, one column per tracked term."""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['debate_id', 'window_start', 'window_end', 'speaker', 'tokens', 'speaking_share', 'top_terms']
+                            + self.tracked_terms)
+            for row in self.rows:
+                writer.writerow([row['debate_id'], row['window_start'], row['window_end'], row['speaker'], row['tokens'],
+                                 f"{row['speaking_share']:.4f}", ' '.join(f"{term}:{count}" for term, count in row['top_terms'])]
+                                + [row['tracked'][term] for term in self.tracked_terms])
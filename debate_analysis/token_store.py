@@ -0,0 +1,115 @@
+"""Memory-mapped token store with zero-copy per-speaker and per-debate views.
+
+The store is a columnar directory (see `debate_analysis.columnar`) whose turns are reordered by
+speaker, then debate, then turn index, so all tokens of a speaker (or of a speaker in one debate)
+are one contiguous range of the flat token array. Views are slices of a `np.memmap`, and counts
+are computed in fixed-size chunks, so queries run over corpora larger than RAM.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+
+from debate_analysis.columnar import COLUMNS, ColumnarTranscripts
+
+SPEAKER_ORDER = 'speaker,debate,turn_index'
+
+
+def build_token_store(columnar_dir, store_dir):
+    """Write a speaker-ordered token store from a columnar export, copying tokens turn by turn without loading them."""
+    source = ColumnarTranscripts(columnar_dir)
+    os.makedirs(store_dir, exist_ok=True)
+
+    order = np.lexsort((source.columns['turn_index'], source.columns['debate'], source.columns['speaker']))
+    lengths = np.diff(source.offsets)[order]
+    offsets = np.zeros(len(order) + 1, dtype=COLUMNS['offsets'])
+    np.cumsum(lengths, out=offsets[1:])
+
+    n_tokens = int(offsets[-1])
+    tokens_path = os.path.join(store_dir, 'tokens.bin')
+    if n_tokens:
+        tokens = np.memmap(tokens_path, dtype=COLUMNS['tokens'], mode='w+', shape=(n_tokens,))
+        for new_turn, old_turn in enumerate(order):
+            tokens[offsets[new_turn]:offsets[new_turn + 1]] = source.turn_tokens(old_turn)
+        tokens.flush()
+        del tokens
+    else:
+        open(tokens_path, 'wb').close()
+
+    offsets.tofile(os.path.join(store_dir, 'offsets.bin'))
+    for column in ('debate', 'turn_index', 'speaker'):
+        np.asarray(source.columns[column][order], dtype=COLUMNS[column]).tofile(os.path.join(store_dir, f"{column}.bin"))
+    for name in ('vocab.json', 'debates.json', 'speakers.json'):
+        shutil.copyfile(os.path.join(columnar_dir, name), os.path.join(store_dir, name))
+
+    meta = dict(source.meta, order=SPEAKER_ORDER)
+    with open(os.path.join(store_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    return TokenStore(store_dir)
+
+
+class TokenStore(ColumnarTranscripts):
+    """A speaker-ordered columnar directory with zero-copy token views and chunked counting."""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        if self.meta.get('order') != SPEAKER_ORDER:
+            raise ValueError(f"'{directory}' is not a token store; build one with build_token_store()")
+
+        speaker_column = self.columns['speaker']
+        self.speaker_index = {speaker: i for i, speaker in enumerate(self.speakers)}
+        self.debate_index = {debate_id: i for i, debate_id in enumerate(self.debates)}
+        bounds = np.searchsorted(speaker_column, np.arange(len(self.speakers) + 1))  # Turn rows of each speaker
+        self.speaker_turns = {speaker: (int(bounds[i]), int(bounds[i + 1])) for i, speaker in enumerate(self.speakers)}
+
+    def _tokens_between(self, first_turn, end_turn):
+        return self.tokens[self.offsets[first_turn]:self.offsets[end_turn]]
+
+    def speaker_turn_range(self, speaker, debate_id=None):
+        """Return the (first, end) turn rows of a speaker, optionally within one debate."""
+        first, end = self.speaker_turns[speaker]
+        if debate_id is None:
+            return first, end
+        debates = self.columns['debate'][first:end]
+        debate = self.debate_index[debate_id]
+        return first + int(np.searchsorted(debates, debate)), first + int(np.searchsorted(debates, debate, side='right'))
+
+    def speaker_tokens(self, speaker, debate_id=None):
+        """All token ids of a speaker (optionally in one debate) as a single zero-copy slice."""
+        return self._tokens_between(*self.speaker_turn_range(speaker, debate_id))
+
+    def debate_tokens(self, debate_id):
+        """The token ids of a debate as {speaker: zero-copy slice}."""
+        return {speaker: self.speaker_tokens(speaker, debate_id) for speaker in self.speakers}
+
+    def iter_turn_tokens(self, speaker, debate_id=None):
+        """Yield the zero-copy token slice of each of a speaker's turns, in debate and turn order."""
+        first, end = self.speaker_turn_range(speaker, debate_id)
+        for turn in range(first, end):
+            yield self.turn_tokens(turn)
+
+    def term_counts(self, speaker=None, debate_id=None, chunk_size=1 << 22):
+        """Count every term id over a speaker's tokens (or every speaker's), optionally in one debate.
+
+        Tokens are read `chunk_size` at a time.
+        """
+        if speaker is not None:
+            slices = [self.speaker_tokens(speaker, debate_id)]
+        elif debate_id is not None:
+            slices = list(self.debate_tokens(debate_id).values())
+        else:
+            slices = [self.tokens]
+        counts = np.zeros(len(self.vocabulary), dtype=np.int64)
+        for tokens in slices:
+            for start in range(0, len(tokens), chunk_size):
+                counts += np.bincount(tokens[start:start + chunk_size], minlength=len(counts))
+        return counts
+
+    def top_terms(self, speaker=None, k=5, debate_id=None):
+        """Return the k most frequent (term, count) pairs of a speaker (or of every speaker), optionally in one debate."""
+        counts = self.term_counts(speaker, debate_id)
+        top = np.lexsort((np.arange(len(counts)), -counts))[:k]  # Highest count first, ties by term id
+        return [(self.vocabulary.terms[i], int(counts[i])) for i in top if counts[i] > 0]
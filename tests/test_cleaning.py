@@ -0,0 +1,47 @@
+"""Checks of the regex tokenizer against word_tokenize's known output; they need neither NLTK nor its Punkt data."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from debate_analysis.cleaning import regex_tokenize_batch
+
+# Text -> the alphabetic tokens word_tokenize keeps from it
+CASES = {
+    "They don’t. Follow the money": ['They', 'don', 't', 'Follow', 'the', 'money'],
+    "It wasn’t. He said so": ['It', 'wasn', 't', 'He', 'said', 'so'],
+    "Roe v. Wade was overturned": ['Roe', 'Wade', 'was', 'overturned'],
+    "Thank you, Mr. President": ['Thank', 'you', 'President'],
+    "That is what I said.": ['That', 'is', 'what', 'I', 'said'],
+    "I can't and we won't, they're gonna win": ['I', 'ca', 'and', 'we', 'wo', 'they', 'gon', 'na', 'win'],
+    "He paid $3,000 in 2020 for a well-known, late-term thing": ['He', 'paid', 'in', 'for', 'a', 'thing'],
+    "“Border” (security) — wait... what?": ['Border', 'security', 'wait', 'what'],
+}
+
+
+def test_known_cases():
+    for text, tokens in CASES.items():
+        assert regex_tokenize_batch([text]) == [tokens], text
+
+
+def test_batch_matches_single_texts():
+    texts = list(CASES)
+    assert regex_tokenize_batch(texts) == [regex_tokenize_batch([text])[0] for text in texts]
+
+
+def test_abbreviation_at_end_of_text_is_kept():
+    # A text boundary ends the sentence, so 'Dr.' loses its period instead of being dropped
+    assert regex_tokenize_batch(['I met Dr.', 'Next text']) == [['I', 'met', 'Dr'], ['Next', 'text']]
+
+
+def test_empty_batch():
+    assert regex_tokenize_batch([]) == []
+    assert regex_tokenize_batch(['']) == [[]]
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+    print("ok")